@@ -0,0 +1,146 @@
+"""
+Micro-batching for optimization requests.
+
+Concurrent /optimize calls against the same player pool are coalesced into a
+single optimize_team_batch call, so the model is built once per batch instead
+of once per request.
+"""
+import asyncio
+import copy
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+import pandas as pd
+from fastapi.concurrency import run_in_threadpool
+from models import OptimizationStrategy
+from optimizer import optimize_team, optimize_team_batch
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class OptimizationBatcher:
+    def __init__(self, max_batch_size: int = 16, max_wait_ms: float = 5.0):
+        """
+        Args:
+            max_batch_size: Maximum number of requests solved in one batch
+            max_wait_ms: How long the first request of a batch waits for others
+                when more are already queued; a lone request never waits
+                (0 disables batching: every request is solved directly)
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        group_key: Hashable,
+        df: pd.DataFrame,
+        budget: int,
+        team_size: int,
+        strategy: OptimizationStrategy
+    ) -> Dict[str, Any]:
+        """
+        Queue one optimization and wait for its result.
+
+        Args:
+            group_key: Identifies the player pool; only requests with an equal key
+                are solved together (e.g. dataset version plus player_ids)
+            df: Player pool to optimize over
+            budget, team_size, strategy: Same as optimize_team
+
+        Returns:
+            The optimize_team result dict
+
+        Raises:
+            ValueError: If no feasible solution exists (same as optimize_team)
+        """
+        if self.max_wait_ms <= 0:
+            return await run_in_threadpool(
+                optimize_team, df, budget=budget, team_size=team_size, strategy=strategy
+            )
+
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((group_key, df, (budget, team_size, strategy), future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        """Start the batching coroutine on the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._pending = set()
+            self._worker = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the batching coroutine and any batches still being solved."""
+        tasks = [t for t in (self._worker, *self._pending) if t is not None and not t.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Requests queued but never collected into a batch
+        while self._queue is not None and not self._queue.empty():
+            self._queue.get_nowait()[-1].cancel()
+        self._worker = None
+        self._pending.clear()
+
+    async def _run(self) -> None:
+        """Collect up to max_batch_size requests or wait max_wait_ms, then dispatch them."""
+        while True:
+            batch = [await self._queue.get()]
+            # A lone request is dispatched at once; the window only applies
+            # when others are already queued behind it
+            window = self.max_wait_ms / 1000 if not self._queue.empty() else 0
+            deadline = self._loop.time() + window
+            try:
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - self._loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                for *_, future in batch:
+                    future.cancel()
+                raise
+
+            # One optimize_team_batch call per player pool; pools are solved
+            # concurrently and the next batch is collected meanwhile
+            groups: Dict[Hashable, List[Tuple]] = {}
+            for item in batch:
+                groups.setdefault(item[0], []).append(item)
+            for items in groups.values():
+                task = self._loop.create_task(self._solve_group(items))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+
+    async def _solve_group(self, items: List[Tuple]) -> None:
+        """Solve the requests of one player pool and resolve their futures."""
+        df = items[0][1]
+        requests = [params for _, _, params, _ in items]
+        if len(items) > 1:
+            logger.info("Solving %d batched optimization requests", len(items))
+        try:
+            results = await run_in_threadpool(optimize_team_batch, df, requests)
+        except asyncio.CancelledError:
+            for *_, future in items:
+                future.cancel()
+            raise
+        except Exception as e:
+            # One copy per request, so concurrent re-raises don't all extend
+            # the traceback of a single shared instance
+            results = [copy.copy(e) for _ in items]
+
+        for (*_, future), result in zip(items, results):
+            if future.done():
+                # Caller went away (e.g. client disconnected)
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
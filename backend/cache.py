@@ -1,33 +1,182 @@
-import pandas as pd
-from typing import Dict, Any, Optional
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+from logger import get_logger
+
+try:
+    import redis.asyncio as redis_asyncio
+    from redis.exceptions import RedisError
+except ImportError:  # optional dependency, only needed when REDIS_URL is set
+    redis_asyncio = None
+    RedisError = OSError
+
+logger = get_logger(__name__)
+
+# Seconds a Redis connect or command may take before the local cache is used,
+# so an unreachable host (dropped packets) doesn't hold requests for the OS
+# TCP timeout
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.2"))
+# Seconds Redis is skipped after a failure before it is tried again
+REDIS_RETRY_INTERVAL = float(os.getenv("REDIS_RETRY_INTERVAL", "5"))
 
 class OptimizationCache:
-    def __init__(self):
-        self._cache: Dict[str, Any] = {}
-    
-    def _generate_dataset_hash(self, df: pd.DataFrame) -> str:
-        """Generate a stable hash for the player dataset."""
-        # Using hash_pandas_object for efficient hashing of DataFrame content
-        # sum() combines the series of hashes into a single value
-        return str(pd.util.hash_pandas_object(df).sum())
-
-    def get_cache_key(self, budget: int, team_size: int, df: pd.DataFrame, strategy: str = "MAX_SCORE") -> str:
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = 3600):
+        """
+        Bounded LRU cache for optimization results.
+
+        Args:
+            maxsize: Maximum number of entries kept; least recently used are evicted
+            ttl: Seconds an entry stays valid (None disables expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key -> (expiry timestamp or None, value), ordered oldest use first
+        self._cache: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    def get_cache_key(
+        self,
+        budget: int,
+        team_size: int,
+        version: str,
+        strategy: str = "MAX_SCORE",
+        player_ids: Optional[Iterable[int]] = None
+    ) -> str:
         """Generate a unique cache key based on inputs."""
-        dataset_hash = self._generate_dataset_hash(df)
-        # Create a unique string key combining inputs and dataset hash
-        return f"opt:{budget}:{team_size}:{strategy}:{dataset_hash}"
+        # The dataset fingerprint (computed once per data load) identifies the
+        # player data, so the frame is not hashed per request; only the
+        # optional pool restriction needs to be part of the key.
+        pool = ",".join(map(str, sorted(set(player_ids)))) if player_ids else "all"
+        return f"opt:{budget}:{team_size}:{strategy}:{version}:{pool}"
 
     def get(self, key: str) -> Optional[Any]:
-        """Retrieve a value from the cache."""
-        return self._cache.get(key)
+        """Retrieve a value from the cache (None if missing or expired)."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return value
 
     def set(self, key: str, value: Any) -> None:
-        """Store a value in the cache."""
-        self._cache[key] = value
+        """Store a value in the cache, evicting the least recently used entry when full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._cache[key] = (expires_at, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
 
     def clear(self) -> None:
         """Clear the entire cache."""
         self._cache.clear()
 
+    async def aget(self, key: str) -> Optional[Any]:
+        """Async variant of get, used by the API so backends can do I/O."""
+        return self.get(key)
+
+    async def aset(self, key: str, value: Any) -> None:
+        """Async variant of set, used by the API so backends can do I/O."""
+        self.set(key, value)
+
+    async def close(self) -> None:
+        """Release backend resources (nothing to do for the in-memory cache)."""
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class RedisOptimizationCache(OptimizationCache):
+    def __init__(self, url: str, maxsize: int = 512, ttl: Optional[float] = 3600):
+        """
+        Optimization cache shared through Redis across workers and restarts.
+
+        Values must be bytes. While Redis is unreachable, the in-memory LRU
+        inherited from OptimizationCache is used instead.
+
+        Args:
+            url: Redis connection URL, e.g. redis://localhost:6379/0
+            maxsize: Size of the in-memory fallback cache
+            ttl: Seconds an entry stays valid (None disables expiry)
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._redis = redis_asyncio.from_url(
+            url,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT
+        )
+        self._redis_ok = True
+        # While Redis is down, monotonic time before which it isn't retried
+        self._retry_at = 0.0
+
+    def _redis_skipped(self) -> bool:
+        # During an outage only one call per retry interval tries Redis again
+        return not self._redis_ok and time.monotonic() < self._retry_at
+
+    def _redis_failed(self, e: Exception) -> None:
+        self._retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        # Warn once per outage rather than on every request
+        if self._redis_ok:
+            logger.warning("Redis unavailable, using in-memory cache: %s", e)
+            self._redis_ok = False
+
+    def _redis_recovered(self) -> None:
+        if not self._redis_ok:
+            logger.info("Redis connection restored")
+            self._redis_ok = True
+
+    async def aget(self, key: str) -> Optional[bytes]:
+        """Retrieve a value from Redis, or from the local cache if Redis is down."""
+        if self._redis_skipped():
+            return self.get(key)
+        try:
+            value = await self._redis.get(key)
+        except (RedisError, OSError) as e:
+            self._redis_failed(e)
+            return self.get(key)
+        self._redis_recovered()
+        return value
+
+    async def aset(self, key: str, value: bytes) -> None:
+        """Store a value in Redis (and locally if Redis is down)."""
+        if self._redis_skipped():
+            self.set(key, value)
+            return
+        try:
+            await self._redis.set(key, value, ex=int(self.ttl) if self.ttl is not None else None)
+        except (RedisError, OSError) as e:
+            self._redis_failed(e)
+            self.set(key, value)
+            return
+        self._redis_recovered()
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
+
+
+def create_optimization_cache() -> OptimizationCache:
+    """
+    Create the optimization cache backend from the environment.
+
+    Environment variables:
+        REDIS_URL: Use a shared Redis cache (requires the redis package);
+            the in-memory cache is used when unset
+
+    Returns:
+        RedisOptimizationCache if REDIS_URL is set and redis is installed,
+        an in-memory OptimizationCache otherwise
+    """
+    redis_url = os.getenv("REDIS_URL", "").strip()
+    if not redis_url:
+        return OptimizationCache()
+    if redis_asyncio is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed; using in-memory cache")
+        return OptimizationCache()
+    logger.info("Using Redis optimization cache")
+    return RedisOptimizationCache(redis_url)
+
 # Global cache instance
-optimization_cache = OptimizationCache()
+optimization_cache = create_optimization_cache()
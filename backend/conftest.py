@@ -0,0 +1,46 @@
+import os
+import pandas as pd
+import pytest
+from data_loader import load_players
+from scoring import calculate_score
+
+PLAYERS_CSV = os.path.join(os.path.dirname(__file__), "players.csv")
+
+
+@pytest.fixture(scope="session")
+def df_scored():
+    """Bundled players.csv, loaded and scored once per test run (treat as read-only)."""
+    return calculate_score(load_players(PLAYERS_CSV))
+
+
+@pytest.fixture(scope="session")
+def optimization_dataset():
+    """Small pool that allows for a valid team selection, built once per test run (treat as read-only)."""
+    # Create 15 players with different roles and prices
+    # Roles: 2 WK, 5 BAT, 4 BOWL, 4 ALL
+    # Built column by column, so pandas does not transpose row dicts
+    names, roles, prices, scores = [], [], [], []
+    
+    def add(name, role, price, score):
+        names.append(name)
+        roles.append(role)
+        prices.append(price)
+        scores.append(score)
+    
+    # Wicket Keepers (need 1)
+    add("WK1", "WK", 10.0, 100)
+    add("WK2", "WK", 8.0, 80)
+    
+    # Batsmen (need 4)
+    for i in range(1, 6):
+        add(f"BAT{i}", "BAT", 9.0, 90)
+        
+    # Bowlers (need 3)
+    for i in range(1, 5):
+        add(f"BOWL{i}", "BOWL", 8.5, 85)
+        
+    # All Rounders (need 3)
+    for i in range(1, 5):
+        add(f"ALL{i}", "ALL", 11.0, 110)
+        
+    return pd.DataFrame({"name": names, "role": roles, "price": prices, "score": scores})
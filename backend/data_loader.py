@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import Any, Dict, List
 from logger import get_logger
 
 logger = get_logger(__name__)
@@ -26,25 +28,48 @@ def load_players(csv_path: str = "players.csv") -> pd.DataFrame:
         logger.error(f"Player data file not found: {csv_path}")
         raise FileNotFoundError(f"Player data file not found: {csv_path}")
     
-    # Load CSV with explicit dtypes for performance (avoids type inference)
+    # Load CSV with explicit dtypes for performance (avoids type inference);
+    # the pyarrow engine parses multi-threaded and coerces/detects NA in one pass.
+    # Names stay Arrow-backed so duplicate checks and hashing use Arrow kernels
+    # instead of per-object Python calls. Runs/wickets are bounded well below
+    # 2**31, so they are read as 32-bit integers. Roles are a handful of
+    # repeated labels, so they are categorical (int8 codes)
     try:
         logger.info(f"Reading player data from: {csv_path}")
         df = pd.read_csv(
             csv_file,
+            engine="pyarrow",
             dtype={
                 "id": "Int64",
-                "name": str,
-                "runs": "Int64",
-                "wickets": "Int64",
+                "name": "string[pyarrow]",
+                "runs": "Int32",
+                "wickets": "Int32",
                 "strike_rate": float,
                 "price": float,
-                "role": str
+                "role": "category"
             }
         )
     except Exception as e:
         logger.error(f"Error reading CSV file: {str(e)}")
         raise ValueError(f"Error reading CSV file: {str(e)}")
     
+    return validate_players(df)
+
+
+def validate_players(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Validate a player DataFrame (as read from CSV or supplied by a client).
+    
+    Args:
+        df: Player data with columns: name, runs, wickets, strike_rate, price, role
+            (and optionally id)
+        
+    Returns:
+        pd.DataFrame: The validated data, with sequential ids added if missing
+        
+    Raises:
+        ValueError: If required columns are missing or data is invalid
+    """
     # Validate required columns
     required_columns = ["name", "runs", "wickets", "strike_rate", "price", "role"]
     missing_columns = set(required_columns) - set(df.columns)
@@ -61,8 +86,8 @@ def load_players(csv_path: str = "players.csv") -> pd.DataFrame:
     
     # Check for empty dataframe
     if df.empty:
-        logger.error("CSV file is empty")
-        raise ValueError("CSV file is empty")
+        logger.error("Player data is empty")
+        raise ValueError("Player data is empty")
 
     # Validate id column: non-null, positive, unique integers
     if df["id"].isnull().any():
@@ -73,35 +98,36 @@ def load_players(csv_path: str = "players.csv") -> pd.DataFrame:
         duplicates = df[df["id"].duplicated()]["id"].tolist()
         raise ValueError(f"Duplicate player ids found: {duplicates}")
     
-    # Check for missing values (vectorized, single pass)
+    # Check for missing values (vectorized, single pass; counts only on error)
     numeric_columns = ["runs", "wickets", "strike_rate", "price"]
-    null_mask = df[numeric_columns].isnull()
-    if null_mask.values.any():
-        null_counts = null_mask.sum()
+    if df[numeric_columns].isna().any(axis=None):
+        null_counts = df[numeric_columns].isna().sum()
         null_cols = null_counts[null_counts > 0].to_dict()
         raise ValueError(f"Invalid numeric values found in columns: {null_cols}")
     
-    # Validate data ranges (vectorized, combined checks for efficiency)
-    runs = df["runs"].values
-    wickets = df["wickets"].values
-    strike_rate = df["strike_rate"].values
-    price = df["price"].values
+    # Validate data ranges (vectorized: one min/max reduction per column,
+    # no intermediate boolean arrays)
+    runs = df["runs"].to_numpy()
+    wickets = df["wickets"].to_numpy()
+    strike_rate = df["strike_rate"].to_numpy()
+    price = df["price"].to_numpy()
     
-    if (runs < 0).any() or (runs > 1000).any():
+    if runs.min() < 0 or runs.max() > 1000:
         raise ValueError("Runs must be between 0 and 1000")
     
-    if (wickets < 0).any() or (wickets > 50).any():
+    if wickets.min() < 0 or wickets.max() > 50:
         raise ValueError("Wickets must be between 0 and 50")
     
-    if (strike_rate < 0).any() or (strike_rate > 250).any():
+    if strike_rate.min() < 0 or strike_rate.max() > 250:
         raise ValueError("Strike rate must be between 0 and 250")
     
-    if (price <= 0).any() or (price > 100).any():
+    if price.min() <= 0 or price.max() > 100:
         raise ValueError("Price must be greater than 0 and at most 100")
     
-    # Check for duplicate player names
-    if df["name"].duplicated().any():
-        duplicates = df[df["name"].duplicated()]["name"].tolist()
+    # Check for duplicate player names (two scalars on the success path;
+    # the duplicate list is only materialized on error)
+    if df["name"].nunique(dropna=False) != len(df):
+        duplicates = df["name"][df["name"].duplicated()].tolist()
         raise ValueError(f"Duplicate player names found: {duplicates}")
     
     # Validate role values
@@ -111,3 +137,35 @@ def load_players(csv_path: str = "players.csv") -> pd.DataFrame:
         raise ValueError(f"Invalid role values found: {invalid_roles}. Allowed roles: {allowed_roles}")
     
     return df
+
+
+def df_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a DataFrame to a list of row dicts (like to_dict('records')).
+    
+    Zipping the column list against plain itertuples rows is faster than
+    to_dict('records') for the narrow player frame. Integer columns may come
+    back as NumPy scalars, so serialize with orjson.OPT_SERIALIZE_NUMPY.
+    """
+    cols = df.columns.tolist()
+    dict_, zip_ = dict, zip  # local names for the comprehension
+    return [dict_(zip_(cols, row)) for row in df.itertuples(index=False, name=None)]
+
+
+def df_records_at(df: pd.DataFrame, positions: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Row dicts for the rows at the given positions (like df_records(df.iloc[positions])).
+    
+    Takes the positions from each column's backing array instead of building
+    an intermediate sub-frame, which dominates for a handful of rows.
+    """
+    cols = df.columns.tolist()
+    values = []
+    for col in cols:
+        series = df[col]
+        if isinstance(series.dtype, np.dtype):
+            values.append(series.to_numpy()[positions].tolist())
+        else:
+            # Extension arrays (nullable ints, Arrow strings, categoricals)
+            values.append(series.array.take(positions).tolist())
+    return [dict(zip(cols, row)) for row in zip(*values)]
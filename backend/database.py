@@ -1,7 +1,7 @@
 """
 Database connection and models using SQLAlchemy
 """
-from sqlalchemy import create_engine, Column, Integer, String, Float
+from sqlalchemy import create_engine, text, Column, Integer, String, Float
 from sqlalchemy.orm import declarative_base, sessionmaker
 from typing import Optional
 import os
@@ -75,17 +75,21 @@ def init_database() -> bool:
         database_url = get_database_url()
         
         # Create engine with connection pooling
-        _engine = create_engine(
-            database_url,
-            pool_pre_ping=True,  # Verify connections before using
-            pool_size=5,
-            max_overflow=10,
-            echo=False  # Set to True for SQL logging
-        )
+        engine_args = {"echo": False}  # Set echo to True for SQL logging
+        if not database_url.startswith("sqlite"):
+            # SQLite is in-process: no server round-trip to verify and no
+            # queue pool to tune, so these only apply to server databases
+            engine_args.update(
+                pool_pre_ping=True,  # Verify connections before using
+                pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
+                pool_size=10,
+                max_overflow=20,
+            )
+        _engine = create_engine(database_url, **engine_args)
         
         # Test connection
         with _engine.connect() as conn:
-            conn.execute("SELECT 1")
+            conn.execute(text("SELECT 1"))
         
         # Create tables if they don't exist
         Base.metadata.create_all(bind=_engine)
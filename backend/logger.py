@@ -1,6 +1,19 @@
 import logging
 import sys
 
+# One console handler, built once at import and shared by the app's loggers.
+# Only loggers obtained through get_logger use it; the root logger (and with
+# it third-party libraries such as httpx, uvicorn, redis and pulp) is left
+# unconfigured.
+# Format: timestamp - module - level - message
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setLevel(logging.INFO)
+_handler.setFormatter(logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+))
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a configured logger instance.
@@ -9,24 +22,13 @@ def get_logger(name: str) -> logging.Logger:
         name: The name of the logger (usually __name__)
         
     Returns:
-        logging.Logger: Configured logger instance
+        logging.Logger: Logger writing INFO and above through the shared handler
     """
     logger = logging.getLogger(name)
     
-    # Only configure if no handlers exist (prevents duplicate logs)
-    if not logger.handlers:
+    # Only configure once per name (prevents duplicate logs)
+    if _handler not in logger.handlers:
         logger.setLevel(logging.INFO)
-        
-        # Console handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(logging.INFO)
-        
-        # Format: timestamp - module - level - message
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        
+        logger.addHandler(_handler)
+    
     return logger
@@ -1,20 +1,34 @@
-from fastapi import FastAPI, HTTPException, Response
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+import hashlib
+import io
 import os
+import threading
+import orjson
+import numpy as np
 import pandas as pd
-from models import BudgetRequest, PlayerResponse, OptimizeResponse
+from models import BudgetRequest, PlayerResponse, OptimizeResponse, OptimizationStrategy
 from player_repository import load_players, get_data_source
+from data_loader import df_records, validate_players
 from database import init_database, close_database
 from scoring import calculate_score
 from optimizer import optimize_team
-from validator import validate_optimization_inputs, ValidationError
+from batcher import OptimizationBatcher
+from validator import role_cheapest_costs, validate_optimization_inputs, ValidationError
 from cache import optimization_cache
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Copy-on-Write: derived frames (scored data, filtered pools) share column
+# buffers with their source until one of them is modified
+pd.options.mode.copy_on_write = True
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -26,9 +40,20 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("⚠ Database unavailable, using CSV fallback")
     
+    # Load and score players up front (in a worker thread) so the first
+    # request doesn't pay for it; failures surface on the endpoints instead
+    try:
+        players = await run_in_threadpool(get_players_data)
+        logger.info("✓ Loaded %d scored players", len(players.df))
+    except Exception as e:
+        logger.warning("⚠ Player data warmup failed: %s", e)
+    
     yield
     
-    # Shutdown: Close database connections
+    # Shutdown: Stop the optimization batcher, release the cache backend and
+    # close database connections
+    await optimization_batcher.stop()
+    await optimization_cache.close()
     logger.info("Closing database connections...")
     close_database()
 
@@ -38,6 +63,7 @@ app = FastAPI(
     title="Cricket Team Optimizer API",
     description="API for optimizing cricket team selection",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -66,24 +92,99 @@ app.add_middleware(
     max_age=3600,
 )
 
-# Cache: Load and score players once at startup
-_cached_players_df: pd.DataFrame = None
+# Optional: set CACHE_ENABLED=false to bypass the optimization result cache
+# entirely (e.g. when benchmarking or debugging the solver)
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").strip().lower() not in ("0", "false", "no")
+
+# Concurrent /optimize requests on the same player pool are solved together;
+# OPTIMIZE_BATCH_WINDOW_MS is how long a request waits for others to join its
+# batch once more are queued; a lone request is solved at once (0 disables
+# batching)
+optimization_batcher = OptimizationBatcher(
+    max_batch_size=int(os.getenv("OPTIMIZE_BATCH_SIZE", "16")),
+    max_wait_ms=float(os.getenv("OPTIMIZE_BATCH_WINDOW_MS", "5"))
+)
+
+# Cache-Control max-age (seconds) for /players; clients revalidate with the
+# ETag afterwards, so a data change is picked up within this window
+PLAYERS_MAX_AGE = int(os.getenv("PLAYERS_CACHE_MAX_AGE", "3600"))
+
+# Player data source; the scored frame is rebuilt when this file changes.
+# Resolved next to this module so the app works from any working directory
+PLAYERS_CSV = os.path.join(os.path.dirname(__file__), "players.csv")
+
+
+class PlayersSnapshot(NamedTuple):
+    """Scored player data and everything derived from it, replaced as a whole on reload."""
+    df: pd.DataFrame
+    # Player id -> row position in df
+    id_positions: Dict[int, int]
+    # role_cheapest_costs(df), so validating the full pool doesn't sort per request
+    role_costs: Dict[Any, np.ndarray]
+    # Content hash of df; used in optimization cache keys so they stay valid
+    # across workers and restarts
+    fingerprint: str
+    # Bumped every time the data is rebuilt (process-local)
+    version: int
+
+
+# Cache: Load and score players once per CSV revision. Readers take the whole
+# snapshot from get_players_data, so a concurrent reload can't mix an old
+# frame with a new id map or cache key
+_players_snapshot: Optional[PlayersSnapshot] = None
+# Serializes (re)loading so concurrent first requests after a restart or CSV
+# change load and score the data once; get_players_data runs in worker threads
+_players_lock = threading.Lock()
+# /players payload as (dataset version, JSON bytes, ETag), rebuilt on version change
+_players_payload_cache: Optional[Tuple[int, bytes, str]] = None
+
+
+def _csv_mtime_ns() -> int:
+    """Get the CSV modification time, or 0 if it doesn't exist (database-only setups)."""
+    try:
+        return os.stat(PLAYERS_CSV).st_mtime_ns
+    except OSError:
+        return 0
+
 
+@lru_cache(maxsize=1)
+def _load_scored_players(csv_mtime_ns: int) -> pd.DataFrame:
+    """Load and score players; memoized on the CSV modification time."""
+    df = load_players(PLAYERS_CSV)
+    df_scored = calculate_score(df)
+    # Ensure a stable integer id column exists for filtering and UI selection.
+    # CSV data does not include IDs; we generate them deterministically.
+    if "id" not in df_scored.columns:
+        df_scored = df_scored.reset_index(drop=True)
+        df_scored.insert(0, "id", range(1, len(df_scored) + 1))
+    return df_scored
 
 
-def get_players_data() -> pd.DataFrame:
-    """Get cached player data, loading if necessary."""
-    global _cached_players_df
-    if _cached_players_df is None:
-        df = load_players()
-        df_scored = calculate_score(df)
-        # Ensure a stable integer id column exists for filtering and UI selection.
-        # CSV data does not include IDs; we generate them deterministically.
-        if "id" not in df_scored.columns:
-            df_scored = df_scored.reset_index(drop=True)
-            df_scored.insert(0, "id", range(1, len(df_scored) + 1))
-        _cached_players_df = df_scored
-    return _cached_players_df
+def get_players_data() -> PlayersSnapshot:
+    """Get cached player data, reloading if the CSV has changed."""
+    global _players_snapshot
+    csv_mtime_ns = _csv_mtime_ns()
+    with _players_lock:
+        df_scored = _load_scored_players(csv_mtime_ns)
+        if _players_snapshot is None or df_scored is not _players_snapshot.df:
+            _players_snapshot = PlayersSnapshot(
+                df=df_scored,
+                id_positions={
+                    player_id: pos
+                    for pos, player_id in enumerate(df_scored["id"].astype(int).tolist())
+                },
+                role_costs=role_cheapest_costs(df_scored),
+                fingerprint=_fingerprint(df_scored),
+                version=(_players_snapshot.version if _players_snapshot else 0) + 1
+            )
+        return _players_snapshot
+
+
+def _fingerprint(df: pd.DataFrame) -> str:
+    """Hash the frame's column names and contents into a short hex digest."""
+    digest = hashlib.blake2b(",".join(df.columns).encode(), digest_size=8)
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
 
 
 @app.get("/")
@@ -99,7 +200,7 @@ async def root():
         "message": "Cricket Team Optimizer API",
         "version": "1.0.0",
         "data_source": data_source,
-        "endpoints": ["/players", "/optimize"]
+        "endpoints": ["/players", "/optimize", "/optimize_bulk"]
     }
 
 
@@ -108,30 +209,48 @@ async def root_head() -> Response:
     return Response(status_code=200)
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in (tag.removeprefix("W/") for tag in candidates)
+
+
 @app.get("/players", response_model=List[PlayerResponse])
-async def get_all_players():
+async def get_all_players(request: Request):
     """
     Get all players with calculated scores.
     
     Returns:
-        List of all players with scores
+        List of all players with scores (304 if the client's ETag is current)
     """
+    global _players_payload_cache
     logger.info("Fetching all players")
     try:
-        # Get cached data
-        df_scored = get_players_data()
+        # Get cached data (off the event loop: first call loads and scores)
+        players = await run_in_threadpool(get_players_data)
+        df_scored = players.df
         
-        # Convert to response models (fast: to_dict('records') vs iterrows)
-        players = [
-            PlayerResponse(**record)
-            for record in df_scored.to_dict('records')
-        ]
+        # Serialize once per dataset version. The data was validated on load,
+        # so the records are dumped directly with orjson instead of being
+        # re-validated row by row through response_model.
+        version = players.version
+        if _players_payload_cache is None or _players_payload_cache[0] != version:
+            body = orjson.dumps(df_records(df_scored), option=orjson.OPT_SERIALIZE_NUMPY)
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            _players_payload_cache = (version, body, etag)
+        _, body, etag = _players_payload_cache
+        headers = {"ETag": etag, "Cache-Control": f"public, max-age={PLAYERS_MAX_AGE}"}
         
-        logger.info(f"Successfully retrieved {len(players)} players")
-        return players
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        
+        logger.info("Successfully retrieved %d players", len(df_scored))
+        return Response(content=body, media_type="application/json", headers=headers)
         
     except Exception as e:
-        logger.error(f"Error loading players: {str(e)}")
+        logger.error("Error loading players: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error loading players: {str(e)}"
@@ -151,76 +270,86 @@ async def optimize_team_endpoint(request: BudgetRequest):
     """
     ids_count = len(request.player_ids) if request.player_ids else 0
     logger.info(
-        f"Optimization request: budget={request.budget}, team_size={request.team_size}, player_ids={ids_count}"
+        "Optimization request: budget=%s, team_size=%s, strategy=%s, player_ids=%d",
+        request.budget, request.team_size, request.strategy.value, ids_count
     )
     try:
-        # Get cached data
-        df_scored = get_players_data()
+        # Get cached data (off the event loop: first call loads and scores).
+        # Everything below uses this one snapshot, even if a reload happens
+        players = await run_in_threadpool(get_players_data)
+        df_scored = players.df
+
+        # Check cache first: the key only depends on the request and the
+        # dataset fingerprint, so a hit skips pool filtering and validation too
+        cache_key = None
+        if CACHE_ENABLED:
+            cache_key = optimization_cache.get_cache_key(
+                budget=request.budget,
+                team_size=request.team_size,
+                version=players.fingerprint,
+                strategy=str(request.strategy),
+                player_ids=request.player_ids
+            )
+            cached_body = await optimization_cache.aget(cache_key)
+            if cached_body is not None:
+                logger.info("Returning cached optimization result")
+                return Response(content=cached_body, media_type="application/json")
 
-        # Optionally restrict optimization pool to selected players
+        # Optionally restrict optimization pool to selected players: rows are
+        # taken by position from the id index, without scanning the id column
         df_pool = df_scored
         if request.player_ids:
             requested_ids = set(request.player_ids)
-            available_ids = set(df_scored["id"].astype(int).tolist())
-            missing_ids = sorted(requested_ids - available_ids)
+            missing_ids = sorted(requested_ids - players.id_positions.keys())
             if missing_ids:
                 raise ValidationError(f"Unknown player_ids: {missing_ids}")
-            df_pool = df_scored[df_scored["id"].isin(request.player_ids)]
-        
-        # Check cache explicitly
-        cache_key = optimization_cache.get_cache_key(
-            budget=request.budget,
-            team_size=request.team_size,
-            strategy=str(request.strategy),
-            df=df_pool
-        )
-        cached_result = optimization_cache.get(cache_key)
-        if cached_result:
-            logger.info("Returning cached optimization result")
-            return cached_result
+            df_pool = df_scored.iloc[sorted(players.id_positions[i] for i in requested_ids)]
         
-        # Validate inputs before optimization
+        # Validate inputs before optimization (the full pool's cheapest-player
+        # costs come with the snapshot; a restricted pool is sorted here)
         validate_optimization_inputs(
             budget=request.budget,
-            df=df_pool
+            df=df_pool,
+            role_costs=players.role_costs if df_pool is df_scored else None
         )
         
-        # Optimize team
-        result = optimize_team(
+        # Optimize team in a worker thread so the solver doesn't block the
+        # event loop, batched with concurrent requests on the same pool
+        pool_key = (
+            players.version,
+            tuple(sorted(set(request.player_ids))) if request.player_ids else None
+        )
+        result = await optimization_batcher.submit(
+            pool_key,
             df_pool,
             budget=request.budget,
             team_size=request.team_size,
             strategy=request.strategy
         )
         
-        # Convert to response format (fast: dict unpacking)
-        selected_players = [
-            PlayerResponse(**p)
-            for p in result["players"]
-        ]
-        
-        response = OptimizeResponse(
-            players=selected_players,
-            total_cost=result["total_cost"],
-            total_score=result["total_score"]
-        )
+        # The optimizer result already has the OptimizeResponse shape, with
+        # rows from the validated player frame, so it is serialized once,
+        # directly with orjson (response_model only documents the shape). The
+        # bytes are what gets cached, so a hit is returned without re-serializing.
+        body = orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY)
         
         # Store in cache
-        optimization_cache.set(cache_key, response)
+        if cache_key is not None:
+            await optimization_cache.aset(cache_key, body)
         
-        logger.info(f"Optimization successful: cost={result['total_cost']}, score={result['total_score']}")
-        return response
+        logger.info("Optimization successful: cost=%s, score=%s", result["total_cost"], result["total_score"])
+        return Response(content=body, media_type="application/json")
         
     except ValidationError as e:
-        logger.warning(f"Validation error: {str(e)}")
+        logger.warning("Validation error: %s", e)
         # Handle validation errors with 400 Bad Request
         raise HTTPException(status_code=400, detail=str(e))
     except ValueError as e:
-        logger.warning(f"Optimization logic error: {str(e)}")
+        logger.warning("Optimization logic error: %s", e)
         # Handle optimization errors with 400 Bad Request
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Unexpected optimization error: {str(e)}", exc_info=True)
+        logger.error("Unexpected optimization error: %s", e, exc_info=True)
         # Handle unexpected errors with 500 Internal Server Error
         raise HTTPException(
             status_code=500,
@@ -228,6 +357,96 @@ async def optimize_team_endpoint(request: BudgetRequest):
         )
 
 
+def _read_parquet_pool(body: bytes) -> pd.DataFrame:
+    """Parse, validate and score a Parquet player pool from a request body."""
+    try:
+        df = pd.read_parquet(io.BytesIO(body))
+    except Exception as e:
+        raise ValueError(f"Error reading Parquet body: {str(e)}")
+    return calculate_score(validate_players(df))
+
+
+def _to_parquet(records: List[Dict[str, Any]]) -> bytes:
+    """Serialize player records as a Parquet file."""
+    buffer = io.BytesIO()
+    pd.DataFrame(records).to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+
+@app.post("/optimize_bulk")
+async def optimize_bulk_endpoint(
+    request: Request,
+    budget: int = Query(gt=0, description="Total budget available"),
+    team_size: int = Query(default=11, ge=1, le=11, description="Number of players to select"),
+    strategy: OptimizationStrategy = Query(
+        default=OptimizationStrategy.MAX_SCORE,
+        description="Optimization strategy to use"
+    )
+):
+    """
+    Optimize team selection over a client-supplied player pool.
+    
+    The request body is a Parquet file (application/octet-stream) with the
+    same columns as players.csv; it is validated and scored like the CSV.
+    Large pools parse much faster from Parquet than from JSON.
+    
+    Returns:
+        Parquet file with the selected players; totals are in the
+        X-Total-Cost and X-Total-Score headers
+    """
+    logger.info(
+        "Bulk optimization request: budget=%s, team_size=%s, strategy=%s",
+        budget, team_size, strategy.value
+    )
+    try:
+        body = await request.body()
+        df_pool = await run_in_threadpool(_read_parquet_pool, body)
+        
+        validate_optimization_inputs(budget=budget, df=df_pool)
+        
+        result = await run_in_threadpool(
+            optimize_team,
+            df_pool,
+            budget=budget,
+            team_size=team_size,
+            strategy=strategy
+        )
+        content = await run_in_threadpool(_to_parquet, result["players"])
+        
+        return Response(
+            content=content,
+            media_type="application/octet-stream",
+            headers={
+                "X-Total-Cost": str(result["total_cost"]),
+                "X-Total-Score": str(result["total_score"])
+            }
+        )
+        
+    except ValidationError as e:
+        logger.warning("Validation error: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except ValueError as e:
+        logger.warning("Bulk optimization error: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("Unexpected bulk optimization error: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Optimization error: {str(e)}"
+        )
+
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools ship with uvicorn[standard]. Each worker process
+    # loads its own read-only copy of the player data; set WEB_CONCURRENCY
+    # to override the worker count.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", max(2, (os.cpu_count() or 1) // 2))),
+        log_level="warning"
+    )
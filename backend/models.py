@@ -37,6 +37,6 @@ class PlayerResponse(BaseModel):
 
 class OptimizeResponse(BaseModel):
     """Response model for optimized team."""
-    players: List[PlayerResponse]
+    players: List[PlayerResponse] = Field(description="Selected players, highest score first")
     total_cost: float
     total_score: float
@@ -1,12 +1,170 @@
+import hashlib
+import heapq
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
 import pulp
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional, Sequence, Tuple, Union
+from data_loader import df_records_at
 from logger import get_logger
 from models import OptimizationStrategy
 
+try:
+    import highspy
+except ImportError:
+    # pulp.HiGHS reports itself unavailable and the CBC fallback is used
+    highspy = None
+
 logger = get_logger(__name__)
 
 
+class _WarmStartHiGHS(pulp.HiGHS):
+    """
+    In-process HiGHS that passes the variables' current values as a MIP start.
+    
+    PuLP's HiGHS API ignores initial values; a feasible start lets branch and
+    bound prune against an incumbent from the first node.
+    """
+    
+    def callSolver(self, lp):
+        # buildSolverModel numbered the columns in lp.variables() order, which
+        # leaves _variables sorted; avoid re-collecting it from every constraint
+        start = [var.varValue for var in lp._variables]
+        if start and None not in start:
+            solution = highspy.HighsSolution()
+            solution.col_value = start
+            lp.solverModel.setSolution(solution)
+        super().callSolver(lp)
+
+
+def _make_solver() -> pulp.LpSolver:
+    """
+    Pick the fastest available MILP solver.
+    
+    Order: HiGHS in-process (highspy), the HiGHS binary, then PuLP's bundled
+    CBC. All of them use the variables' current values as a warm start. Each
+    solve uses its own solver model / temporary files, so the instance is
+    safe to share across threads. SOLVER_THREADS enables parallel
+    branch-and-bound; it is off by default since requests are already solved
+    concurrently across workers and threads.
+    """
+    threads = os.getenv("SOLVER_THREADS")
+    threads = int(threads) if threads else None
+    
+    # msg=False only drops PuLP's log callback; output_flag silences HiGHS itself
+    highs = _WarmStartHiGHS(msg=False, threads=threads, output_flag=False)
+    if highs.available():
+        return highs
+    highs_cmd = pulp.HiGHS_CMD(msg=False, warmStart=True, threads=threads)
+    if highs_cmd.available():
+        return highs_cmd
+    return pulp.PULP_CBC_CMD(msg=0, warmStart=True, threads=threads)
+
+
+# Shared solver (deterministic and stable)
+_SOLVER = _make_solver()
+logger.info("Using %s for team optimization", _SOLVER.name)
+
+# Largest dynamic program (per-group traceback tables of players x count x
+# budget steps, plus budget steps squared per group combination) the exact
+# knapsack may allocate before the LP is used instead. At the cap one build
+# needs at most 8 bytes per cell (160 MB, float64 convolution rows) while it
+# runs; only the 1-byte traceback masks are kept afterwards (at most 20 MB)
+_KNAPSACK_MAX_CELLS = 20_000_000
+
+# Last optimal selection (as row positions) per constraint structure. A
+# solution stays feasible when only the objective or a larger budget changes,
+# so it seeds the next solve of the same pool (e.g. a budget sweep)
+_WARM_START_SIZE = 64
+_warm_starts: "OrderedDict[bytes, List[int]]" = OrderedDict()
+_warm_starts_lock = threading.Lock()
+
+# Knapsack tables (see _solve_knapsack) per pool, constraints and strategy.
+# They are built for every budget the pool can use, so a budget sweep only
+# traces each team back. The cache is bounded by the bytes its tables hold,
+# not by entries, so every worker process keeps at most this much
+_KNAPSACK_CACHE_BYTES = 64 * 1024 * 1024
+_knapsack_tables: "OrderedDict[bytes, _KnapsackTables]" = OrderedDict()
+_knapsack_tables_lock = threading.Lock()
+
+
+class PlayerArrays(NamedTuple):
+    """Column-wise (structure of arrays) view of the player frame used by the solver."""
+    index: List[Any]
+    prices: np.ndarray
+    scores: np.ndarray
+    role_codes: np.ndarray
+    role_positions: Dict[Any, List[int]]
+    # Prices as whole multiples of price_step cents (None unless every price
+    # is a non-negative number of cents)
+    price_steps: Optional[np.ndarray]
+    price_step: int
+
+
+class _KnapsackTables(NamedTuple):
+    """Budget-independent part of the knapsack DP, read-only once built."""
+    # Best objective of all groups within c budget steps, for c up to capacity
+    best: np.ndarray
+    # splits[g][c]: steps given to group g + 1 when c is shared with it
+    splits: List[np.ndarray]
+    # Per group: candidate positions in update order and their improvement masks
+    traces: List[Tuple[List[int], List[Optional[np.ndarray]]]]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the arrays of these tables."""
+        masks = sum(mask.nbytes for _, taken in self.traces for mask in taken if mask is not None)
+        return self.best.nbytes + sum(split.nbytes for split in self.splits) + masks
+
+
+def _player_arrays(df: pd.DataFrame) -> PlayerArrays:
+    """Extract the solver columns once as contiguous NumPy arrays."""
+    prices = df["price"].to_numpy(dtype=np.float64)
+    price_steps, price_step = None, 1
+    cents = np.rint(prices * 100)
+    if not (cents < 0).any() and np.allclose(cents, prices * 100, rtol=0, atol=1e-6):
+        cents = cents.astype(np.int64)
+        if (cents > 0).any():
+            price_step = int(np.gcd.reduce(cents[cents > 0]))
+        price_steps = cents // price_step
+    
+    # Integer role codes (the categorical codes as loaded, or factorized once
+    # for plain string columns) and the row positions per role, so each role
+    # constraint only visits its own players, found by integer compares
+    role_codes, role_names = pd.factorize(df["role"])
+    role_positions = {
+        role: np.flatnonzero(role_codes == code).tolist()
+        for code, role in enumerate(role_names.tolist())
+    }
+    return PlayerArrays(
+        index=df.index.tolist(),
+        prices=prices,
+        scores=df["score"].to_numpy(dtype=np.float64),
+        role_codes=role_codes,
+        role_positions=role_positions,
+        price_steps=price_steps,
+        price_step=price_step
+    )
+
+
+def _budget_bound(arrays: PlayerArrays, budget: float) -> Union[int, float]:
+    """Budget in the units of the budget constraint (price steps when available)."""
+    if arrays.price_steps is None:
+        return budget
+    # Tolerance absorbs float noise in budget * 100 (e.g. 1.15 * 100 = 114.999...)
+    return int(np.floor(budget * 100 / arrays.price_step + 1e-9))
+
+
+DEFAULT_ROLE_CONSTRAINTS = {
+    "WK": 1,
+    "BAT": 4,
+    "BOWL": 3,
+    "ALL": 3
+}
+
+
 def optimize_team(
     df: pd.DataFrame,
     budget: int,
@@ -15,7 +173,13 @@ def optimize_team(
     strategy: OptimizationStrategy = OptimizationStrategy.MAX_SCORE
 ) -> Dict[str, Any]:
     """
-    Optimize cricket team selection using Linear Programming.
+    Optimize cricket team selection.
+    
+    The model is a knapsack with exact per-role counts and is solved exactly
+    by dynamic programming over the role groups when prices are whole cents
+    (see _solve_knapsack); otherwise, or when the tables would be too large,
+    it is solved as an integer Linear Program. Neither runs when the best
+    team regardless of price already fits the budget.
     
     Objective:
         Maximize total score or efficiency based on strategy.
@@ -33,22 +197,103 @@ def optimize_team(
         strategy: Optimization strategy (MAX_SCORE or MAX_SCORE_PER_COST)
     
     Returns:
-        Dict containing:
-            - players: List of selected player records (as dicts)
+        Dict in the OptimizeResponse shape, containing:
+            - players: List of selected player records (as dicts, one key per column),
+              highest score first
             - total_cost: Total price of selected team
             - total_score: Total score of selected team
     
     Raises:
         ValueError: If required columns are missing or no feasible solution exists
     """
-    # Set default role constraints if not provided
+    _validate_inputs(df, budget, team_size)
+    arrays = _player_arrays(df)
+    _check_affordable(arrays, budget, _min_team_cost(arrays, team_size, role_constraints))
+    result = _solve_if_budget_slack(df, arrays, budget, team_size, role_constraints, strategy)
+    if result is not None:
+        return result
+    result = _solve_knapsack(df, arrays, budget, team_size, role_constraints, strategy)
+    if result is not None:
+        return result
+    prob, player_vars = _build_problem(arrays, team_size, role_constraints, strategy)
+    warm_key = _structure_key(arrays, team_size, role_constraints)
+    return _solve_for_budget(prob, player_vars, df, arrays, budget, warm_key)
+
+
+def optimize_team_batch(
+    df: pd.DataFrame,
+    requests: Sequence[Tuple[int, int, OptimizationStrategy]],
+    role_constraints: Optional[Dict[str, int]] = None
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Optimize several (budget, team_size, strategy) requests against the same players.
+    
+    Requests sharing team_size and strategy share one LP model: it is built
+    once and re-solved per budget (in ascending order) by only changing the
+    budget bound, with the previous selection passed as a warm start.
+    
+    Args:
+        df: DataFrame with columns: name, price, score, role
+        requests: Sequence of (budget, team_size, strategy) tuples
+        role_constraints: Dict mapping role names to required counts
+    
+    Returns:
+        One entry per request, in order: the optimize_team result dict, or the
+        exception raised for that request (e.g. ValueError for an infeasible budget)
+    """
+    results: List[Union[Dict[str, Any], Exception]] = [None] * len(requests)
+    
+    # Group request positions by model structure
+    groups: Dict[Tuple[int, OptimizationStrategy], List[int]] = {}
+    for pos, (budget, team_size, strategy) in enumerate(requests):
+        groups.setdefault((team_size, strategy), []).append(pos)
+    
+    arrays = None
+    for (team_size, strategy), positions in groups.items():
+        problem = warm_key = min_cost = None
+        for pos in sorted(positions, key=lambda p: requests[p][0]):
+            budget = requests[pos][0]
+            try:
+                _validate_inputs(df, budget, team_size)
+                if arrays is None:
+                    arrays = _player_arrays(df)
+                if min_cost is None:
+                    min_cost = _min_team_cost(arrays, team_size, role_constraints)
+                _check_affordable(arrays, budget, min_cost)
+                result = _solve_if_budget_slack(df, arrays, budget, team_size, role_constraints, strategy)
+                if result is None:
+                    result = _solve_knapsack(df, arrays, budget, team_size, role_constraints, strategy)
+                if result is not None:
+                    results[pos] = result
+                    continue
+                if problem is None:
+                    problem = _build_problem(arrays, team_size, role_constraints, strategy)
+                    warm_key = _structure_key(arrays, team_size, role_constraints)
+                results[pos] = _solve_for_budget(*problem, df, arrays, budget, warm_key)
+            except Exception as e:
+                results[pos] = e
+    
+    return results
+
+
+def _structure_key(
+    arrays: PlayerArrays,
+    team_size: int,
+    role_constraints: Optional[Dict[str, int]]
+) -> bytes:
+    """Hash everything that defines the feasible set except the budget."""
     if role_constraints is None:
-        role_constraints = {
-            "WK": 1,
-            "BAT": 4,
-            "BOWL": 3,
-            "ALL": 3
-        }
+        role_constraints = DEFAULT_ROLE_CONSTRAINTS
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr((arrays.index, team_size, sorted(role_constraints.items()))).encode())
+    h.update(arrays.prices.tobytes())
+    h.update(repr(list(arrays.role_positions)).encode())
+    h.update(arrays.role_codes.tobytes())
+    return h.digest()
+
+
+def _validate_inputs(df: pd.DataFrame, budget: int, team_size: int) -> None:
+    """Check the frame and request parameters before building a model."""
     # Validate required columns
     required_columns = ["name", "price", "score", "role"]
     missing_columns = set(required_columns) - set(df.columns)
@@ -67,12 +312,351 @@ def optimize_team(
     
     if budget <= 0:
         raise ValueError(f"budget must be positive, got {budget}")
+
+
+def _min_team_cost(
+    arrays: PlayerArrays,
+    team_size: int,
+    role_constraints: Optional[Dict[str, int]]
+) -> float:
+    """
+    Cost of the cheapest team meeting the size and role constraints (inf if none exists).
+    
+    Each constrained role takes exactly its count, so the cheapest team is the
+    cheapest players of every constrained role plus the cheapest players of
+    the unconstrained roles for the remaining slots. Any budget at or above
+    this cost is feasible. Costs are in budget-constraint units (see _budget_bound).
+    """
+    if role_constraints is None:
+        role_constraints = DEFAULT_ROLE_CONSTRAINTS
+    weights = arrays.prices if arrays.price_steps is None else arrays.price_steps
+    
+    def cheapest(role_weights: np.ndarray, count: int) -> float:
+        if count < 0 or count > len(role_weights):
+            return float("inf")
+        if count == 0:
+            return 0
+        return np.partition(role_weights, count - 1)[:count].sum()
+    
+    unconstrained = np.ones(len(weights), dtype=bool)
+    cost = 0
+    for role, required_count in role_constraints.items():
+        positions = arrays.role_positions.get(role, [])
+        unconstrained[positions] = False
+        cost += cheapest(weights[positions], required_count)
+    remaining = team_size - sum(role_constraints.values())
+    return cost + cheapest(weights[unconstrained], remaining)
+
+
+def _check_affordable(arrays: PlayerArrays, budget: int, min_cost: float) -> None:
+    """Fail like an infeasible solve, without solving, if no valid team fits the budget."""
+    if min_cost > _budget_bound(arrays, budget):
+        logger.warning("Optimization failed. Status: Infeasible (cheapest valid team exceeds budget)")
+        raise ValueError("No optimal solution found. Status: Infeasible")
+
+
+def _solve_if_budget_slack(
+    df: pd.DataFrame,
+    arrays: PlayerArrays,
+    budget: int,
+    team_size: int,
+    role_constraints: Optional[Dict[str, int]],
+    strategy: OptimizationStrategy
+) -> Optional[Dict[str, Any]]:
+    """
+    Best team ignoring the budget, when that team fits the budget anyway.
     
-    # Extract numpy arrays for faster access (avoids repeated .loc[] calls)
-    indices = df.index.tolist()
-    scores = df["score"].values
-    prices = df["price"].values
-    roles = df["role"].values
+    Without the budget, the best players by objective of every role group
+    form an optimal team; if they fit, no solve is needed. O(players).
+    
+    Returns:
+        The optimize_team result dict, or None when the budget binds (or a
+        group lacks players, which the solvers report)
+    """
+    groups = _role_groups(arrays, team_size, role_constraints)
+    if any(count > len(positions) for positions, count in groups):
+        return None
+    values = _objective_coefficients(arrays.prices, arrays.scores, strategy)
+    selected = []
+    for positions, count in groups:
+        best = np.argpartition(-values[positions], count - 1)[:count]
+        selected.extend(positions[best].tolist())
+    
+    weights = arrays.prices if arrays.price_steps is None else arrays.price_steps
+    if weights[selected].sum() > _budget_bound(arrays, budget):
+        return None
+    selected.sort()
+    return _team_result(df, arrays, selected)
+
+
+def _objective_coefficients(
+    prices: np.ndarray,
+    scores: np.ndarray,
+    strategy: OptimizationStrategy
+) -> np.ndarray:
+    """Per-player objective weights for the strategy."""
+    prices = np.asarray(prices, dtype=np.float64)
+    scores = np.asarray(scores, dtype=np.float64)
+    if strategy != OptimizationStrategy.MAX_SCORE_PER_COST:
+        # Default Strategy: Maximize Total Score
+        return scores
+    
+    # Strategy: Maximize sum of (score/cost) for each player (Efficiency),
+    # computed for all players in one pass. If price is 0, assign high
+    # efficiency if score > 0 (the division result is discarded there)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            prices > 0,
+            scores / prices,
+            np.where(scores > 0, scores * 1000.0, 0.0)
+        )
+
+
+def _solve_knapsack(
+    df: pd.DataFrame,
+    arrays: PlayerArrays,
+    budget: int,
+    team_size: int,
+    role_constraints: Optional[Dict[str, int]],
+    strategy: OptimizationStrategy
+) -> Optional[Dict[str, Any]]:
+    """
+    Exact dynamic program over the role groups.
+    
+    Every constrained role is a group that supplies exactly its count, and
+    the players of the other roles form one group for the remaining slots.
+    Per group, best[k, c] is the best objective of k of its players costing
+    at most c budget steps (the gcd of the prices in cents); each player
+    updates every (k, c) cell in one vectorized step, and the improvements
+    are kept to trace the team back. The groups' rows for their counts are
+    then combined one group at a time by a max-plus convolution over the
+    budget, remembering how each budget was split. O(players * count *
+    budget steps + groups * budget steps ** 2), after dropping players that
+    at least count others of their group match or beat on price and objective.
+    
+    Both steps are independent of the budget, so they run up to the cost of
+    the dearest possible team and are cached per pool, constraints and
+    strategy; each budget then only traces its team back.
+    
+    Returns:
+        The optimize_team result dict, or None when the DP does not apply
+        (prices not in whole cents, negative, or tables that are too large)
+    
+    Raises:
+        ValueError: If no team meeting the constraints fits in the budget
+    """
+    weights = arrays.price_steps
+    if weights is None:
+        return None
+    groups = _role_groups(arrays, team_size, role_constraints)
+    if any(count > len(positions) for positions, count in groups):
+        logger.warning("Optimization failed. Status: Infeasible")
+        raise ValueError("No optimal solution found. Status: Infeasible")
+    
+    def cells(capacity: int) -> int:
+        total = sum(len(positions) * count for positions, count in groups) * (capacity + 1)
+        return total + (len(groups) - 1) * (capacity + 1) ** 2
+    
+    # No team can cost more than the most expensive players of every group,
+    # so tables up to that cost answer every budget and are cached; cells
+    # for budgets up to c only depend on cells up to c
+    budget_steps = _budget_bound(arrays, budget)
+    full_capacity = sum(
+        int(np.sort(weights[positions])[-count:].sum()) for positions, count in groups
+    )
+    key = None
+    if cells(full_capacity) <= _KNAPSACK_MAX_CELLS:
+        capacity = full_capacity
+        h = hashlib.blake2b(_structure_key(arrays, team_size, role_constraints), digest_size=16)
+        h.update(arrays.scores.tobytes())
+        h.update(strategy.value.encode())
+        key = h.digest()
+        with _knapsack_tables_lock:
+            tables = _knapsack_tables.get(key)
+            if tables is not None:
+                _knapsack_tables.move_to_end(key)
+    else:
+        capacity = min(budget_steps, full_capacity)
+        if capacity < 0 or cells(capacity) > _KNAPSACK_MAX_CELLS:
+            return None
+        tables = None
+    
+    if tables is None:
+        tables = _build_knapsack_tables(arrays, groups, capacity, strategy)
+        if key is not None:
+            with _knapsack_tables_lock:
+                _knapsack_tables[key] = tables
+                # Least recently used first; tables larger than the whole
+                # cache are not kept at all
+                cached_bytes = sum(t.nbytes for t in _knapsack_tables.values())
+                while cached_bytes > _KNAPSACK_CACHE_BYTES:
+                    cached_bytes -= _knapsack_tables.popitem(last=False)[1].nbytes
+    
+    c = min(budget_steps, capacity)
+    if c < 0 or tables.best[c] == -np.inf:
+        logger.warning("Optimization failed. Status: Infeasible")
+        raise ValueError("No optimal solution found. Status: Infeasible")
+    
+    # Share the budget out between the groups, last group first, then walk
+    # each group's players backwards, following the updates that built it
+    spends = [0] * len(groups)
+    for g in range(len(groups) - 1, 0, -1):
+        spends[g] = int(tables.splits[g - 1][c])
+        c -= spends[g]
+    spends[0] = c
+    
+    selected = []
+    for (_, count), (candidates, taken), spend in zip(groups, tables.traces, spends):
+        k, c = count, spend
+        for pos, improved in zip(reversed(candidates), reversed(taken)):
+            if k == 0:
+                break
+            weight = int(weights[pos])
+            if improved is not None and c >= weight and improved[k - 1, c - weight]:
+                selected.append(pos)
+                k -= 1
+                c -= weight
+    selected.sort()
+    
+    return _team_result(df, arrays, selected)
+
+
+def _build_knapsack_tables(
+    arrays: PlayerArrays,
+    groups: List[Tuple[np.ndarray, int]],
+    capacity: int,
+    strategy: OptimizationStrategy
+) -> _KnapsackTables:
+    """Per-group tables for budgets up to capacity steps, combined across the groups."""
+    values = _objective_coefficients(arrays.prices, arrays.scores, strategy)
+    tables = [
+        _group_table(arrays.price_steps, values, positions, count, capacity)
+        for positions, count in groups
+    ]
+    best = tables[0][0]
+    splits = []
+    for row, _, _ in tables[1:]:
+        best, split = _max_plus(best, row)
+        splits.append(split)
+    return _KnapsackTables(
+        best=best,
+        splits=splits,
+        traces=[(candidates, taken) for _, candidates, taken in tables]
+    )
+
+
+def _role_groups(
+    arrays: PlayerArrays,
+    team_size: int,
+    role_constraints: Optional[Dict[str, int]]
+) -> List[Tuple[np.ndarray, int]]:
+    """Player positions and required count of every group that supplies players."""
+    if role_constraints is None:
+        role_constraints = DEFAULT_ROLE_CONSTRAINTS
+    unconstrained = np.ones(len(arrays.prices), dtype=bool)
+    groups = []
+    for role, required_count in role_constraints.items():
+        positions = np.asarray(arrays.role_positions.get(role, []), dtype=np.intp)
+        unconstrained[positions] = False
+        if required_count:
+            groups.append((positions, required_count))
+    remaining = team_size - sum(role_constraints.values())
+    if remaining:
+        groups.append((np.flatnonzero(unconstrained), remaining))
+    return groups
+
+
+def _group_table(
+    weights: np.ndarray,
+    values: np.ndarray,
+    positions: np.ndarray,
+    count: int,
+    capacity: int
+) -> Tuple[np.ndarray, List[int], List[Optional[np.ndarray]]]:
+    """
+    Knapsack over one group's players for exactly count of them.
+    
+    Returns:
+        best[count] (the best objective within c budget steps, -inf where no
+        count players fit), the candidate positions in update order and the
+        improvement mask of each candidate (None if it never fits)
+    """
+    candidates = positions[
+        _undominated(weights[positions].tolist(), values[positions].tolist(), count)
+    ].tolist()
+    
+    best = np.full((count + 1, capacity + 1), -np.inf)
+    best[0] = 0.0
+    taken = []
+    for pos in candidates:
+        weight, value = int(weights[pos]), values[pos]
+        if weight > capacity:
+            taken.append(None)
+            continue
+        # Right-hand side is evaluated first, so each player is used at most once
+        candidate = best[:-1, :capacity + 1 - weight] + value
+        improved = candidate > best[1:, weight:]
+        best[1:, weight:] = np.where(improved, candidate, best[1:, weight:])
+        taken.append(improved)
+    return best[count], candidates, taken
+
+
+def _max_plus(left: np.ndarray, right: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Max-plus convolution of two budget rows of the same length.
+    
+    Returns:
+        combined[c] = max over s of left[c - s] + right[s], and the best s for
+        every c (the share of c given to right)
+    """
+    n = len(left)
+    # window[c, s] = left[c - s], -inf where s > c
+    padded = np.concatenate((np.full(n - 1, -np.inf), left))
+    sums = np.lib.stride_tricks.sliding_window_view(padded, n)[:, ::-1] + right
+    split = sums.argmax(axis=1)
+    return sums[np.arange(n), split], split
+
+
+def _undominated(weights: List[int], values: List[float], team_size: int) -> List[int]:
+    """
+    Positions of players that can appear in an optimal team.
+    
+    A player matched or beaten on price and objective by team_size others is
+    never needed: any team containing it leaves one of them out to swap in.
+    """
+    # Cheapest first (best objective first within a price), keeping the
+    # team_size best objectives seen so far in a min-heap
+    order = sorted(range(len(weights)), key=lambda pos: (weights[pos], -values[pos]))
+    top: List[float] = []
+    keep = []
+    for pos in order:
+        value = values[pos]
+        if len(top) < team_size:
+            heapq.heappush(top, value)
+        elif top[0] >= value:
+            continue
+        else:
+            heapq.heapreplace(top, value)
+        keep.append(pos)
+    return sorted(keep)
+
+
+def _build_problem(
+    arrays: PlayerArrays,
+    team_size: int,
+    role_constraints: Optional[Dict[str, int]],
+    strategy: OptimizationStrategy
+) -> Tuple[pulp.LpProblem, Dict[Any, pulp.LpVariable]]:
+    """Build the selection model; the budget bound is set per solve."""
+    # Set default role constraints if not provided
+    if role_constraints is None:
+        role_constraints = DEFAULT_ROLE_CONSTRAINTS
+    
+    # Model coefficients as plain Python lists, zipped against the variable
+    # list: avoids per-element NumPy indexing and NumPy scalar arithmetic
+    # while the expressions are built
+    indices = arrays.index
+    prices = arrays.prices.tolist()
     
     # Create optimization problem
     prob = pulp.LpProblem("Cricket_Team_Optimization", pulp.LpMaximize)
@@ -82,55 +666,70 @@ def optimize_team(
         idx: pulp.LpVariable(f"player_{idx}", cat="Binary")
         for idx in indices
     }
+    var_list = list(player_vars.values())
+    
+    # Expressions and constraints are constructed directly from (variable,
+    # coefficient) pairs: a single dict build each, instead of lpSum adding
+    # one term at a time and comparison operators copying the expression
     
     # Objective: Maximize based on strategy
+    objective = _objective_coefficients(arrays.prices, arrays.scores, strategy).tolist()
     if strategy == OptimizationStrategy.MAX_SCORE_PER_COST:
-        # Strategy: Maximize sum of (score/cost) for each player (Efficiency)
-        # Note: If price is 0, we handle it to avoid division by zero
-        efficiencies = []
-        for i in range(len(prices)):
-            price = prices[i]
-            score = scores[i]
-            if price > 0:
-                efficiencies.append(score / price)
-            else:
-                # If price is 0, assign high efficiency if score > 0
-                efficiencies.append(score * 1000 if score > 0 else 0)
-                
-        prob += pulp.lpSum(
-            efficiencies[i] * player_vars[idx]
-            for i, idx in enumerate(indices)
-        ), "Total_Efficiency"
+        prob += pulp.LpAffineExpression(zip(var_list, objective)), "Total_Efficiency"
     else:
-        # Default Strategy: Maximize Total Score
-        prob += pulp.lpSum(
-            scores[i] * player_vars[idx]
-            for i, idx in enumerate(indices)
-        ), "Total_Score"
+        prob += pulp.LpAffineExpression(zip(var_list, objective)), "Total_Score"
     
-    # Constraint 1: Total price <= budget (using pre-extracted arrays)
-    prob += pulp.lpSum(
-        prices[i] * player_vars[idx]
-        for i, idx in enumerate(indices)
-    ) <= budget, "Budget_Constraint"
+    # Constraint 1: Total price <= budget (bound is set in _solve_for_budget).
+    # Integer price steps keep the row exact: no feasibility tolerance on
+    # fractional prices letting a team exceed the budget by a rounding error
+    budget_coefs = arrays.price_steps.tolist() if arrays.price_steps is not None else prices
+    prob += pulp.LpConstraint(
+        zip(var_list, budget_coefs), sense=pulp.LpConstraintLE, rhs=0, name="Budget_Constraint"
+    )
     
     # Constraint 2: Select exactly team_size players
-    prob += pulp.lpSum(
-        player_vars[idx]
-        for idx in indices
-    ) == team_size, "Team_Size_Constraint"
+    prob += pulp.LpConstraint(
+        ((var, 1) for var in var_list),
+        sense=pulp.LpConstraintEQ, rhs=team_size, name="Team_Size_Constraint"
+    )
     
     # Constraint 3: Role-based constraints (dynamic)
     for role, required_count in role_constraints.items():
-        prob += pulp.lpSum(
-            player_vars[idx]
-            for i, idx in enumerate(indices)
-            if roles[i] == role
-        ) == required_count, f"{role}_Constraint"
+        prob += pulp.LpConstraint(
+            ((var_list[pos], 1) for pos in arrays.role_positions.get(role, ())),
+            sense=pulp.LpConstraintEQ, rhs=required_count, name=f"{role}_Constraint"
+        )
     
-    # Solve the problem using CBC solver (deterministic and stable)
-    solver = pulp.PULP_CBC_CMD(msg=0)
-    prob.solve(solver)
+    return prob, player_vars
+
+
+def _solve_for_budget(
+    prob: pulp.LpProblem,
+    player_vars: Dict[Any, pulp.LpVariable],
+    df: pd.DataFrame,
+    arrays: PlayerArrays,
+    budget: int,
+    warm_key: Optional[bytes] = None
+) -> Dict[str, Any]:
+    """
+    Solve the model for one budget and extract the selected team.
+    
+    A freshly built model is seeded with the last selection stored under
+    warm_key; a re-solved model already carries its previous solution.
+    """
+    # sum(price) <= budget is stored as sum(price) - budget <= 0
+    prob.constraints["Budget_Constraint"].constant = -_budget_bound(arrays, budget)
+    
+    if warm_key is not None and next(iter(player_vars.values())).varValue is None:
+        with _warm_starts_lock:
+            start = _warm_starts.get(warm_key)
+        if start is not None:
+            chosen = set(start)
+            for pos, var in enumerate(player_vars.values()):
+                var.setInitialValue(1 if pos in chosen else 0)
+    
+    # Solve the problem using the shared solver
+    prob.solve(_SOLVER)
     
     # Check if solution was found
     if prob.status != pulp.LpStatusOptimal:
@@ -138,19 +737,37 @@ def optimize_team(
         logger.warning(f"Optimization failed. Status: {status_msg}")
         raise ValueError(f"No optimal solution found. Status: {status_msg}")
     
-    # Extract selected players
-    selected_indices = [
-        idx for idx in df.index
-        if player_vars[idx].varValue == 1
+    # Extract selected player positions in one pass over the variables
+    # (created in row order). HiGHS may return binaries within its
+    # integrality tolerance, e.g. 0.9999999, rather than exactly 1
+    selected = [
+        pos for pos, var in enumerate(player_vars.values())
+        if var.varValue > 0.5
     ]
     
+    if warm_key is not None:
+        with _warm_starts_lock:
+            _warm_starts[warm_key] = selected
+            _warm_starts.move_to_end(warm_key)
+            while len(_warm_starts) > _WARM_START_SIZE:
+                _warm_starts.popitem(last=False)
+    
+    return _team_result(df, arrays, selected)
+
+
+def _team_result(df: pd.DataFrame, arrays: PlayerArrays, selected: List[int]) -> Dict[str, Any]:
+    """Build the response dict for the selected row positions, highest score first."""
+    positions = np.asarray(selected, dtype=np.intp)
+    # Ranked once here, so clients showing the top players can just slice;
+    # the stable sort keeps row order between equal scores
+    positions = positions[np.argsort(-arrays.scores[positions], kind="stable")]
+    
     # Get selected players as list of dicts
-    selected_df = df.loc[selected_indices]
-    players_list = selected_df.to_dict('records')
+    players_list = df_records_at(df, positions)
     
-    # Calculate totals
-    total_cost = float(selected_df["price"].sum())
-    total_score = float(selected_df["score"].sum())
+    # Calculate totals from the price/score arrays
+    total_cost = float(arrays.prices[positions].sum())
+    total_score = float(arrays.scores[positions].sum())
     
     return {
         "players": players_list,
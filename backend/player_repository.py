@@ -3,12 +3,16 @@ Player repository for loading data from database or CSV
 """
 import pandas as pd
 from typing import Optional
+from sqlalchemy import insert, select
 from database import Player, get_session, is_database_available, init_database
 from data_loader import load_players as load_players_from_csv
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Rows fetched per round trip when loading players from the database
+DB_CHUNK_SIZE = 1000
+
 
 def sync_csv_to_database(csv_path: str = "players.csv") -> int:
     """
@@ -40,29 +44,25 @@ def sync_csv_to_database(csv_path: str = "players.csv") -> int:
         # Clear existing data (optional - comment out to preserve existing data)
         session.query(Player).delete()
         
-        # Insert players from CSV
-        players_added = 0
-        for _, row in df.iterrows():
-            player = Player(
-                name=row['name'],
-                runs=int(row['runs']),
-                wickets=int(row['wickets']),
-                strike_rate=float(row['strike_rate']),
-                price=float(row['price']),
-                role=row['role']
-            )
-            session.add(player)
-            players_added += 1
+        # Insert players from CSV as one executemany (multi-row INSERT where
+        # the driver supports it) instead of one ORM object per row
+        columns = ['name', 'runs', 'wickets', 'strike_rate', 'price', 'role']
+        records = df[columns].astype({
+            'runs': int,
+            'wickets': int,
+            'strike_rate': float,
+            'price': float
+        }).to_dict('records')
+        session.execute(insert(Player), records)
+        session.commit()
+        players_added = len(records)
         
         logger.info(f"✓ Synced {players_added} players from CSV to database")
         return players_added
         
     except Exception as e:
         session.rollback()
-        logger.error
-    except Exception as e:
-        session.rollback()
-        print(f"Error syncing CSV to database: {e}")
+        logger.error(f"Error syncing CSV to database: {e}")
         raise
     finally:
         session.close()
@@ -82,36 +82,37 @@ def load_players_from_database() -> Optional[pd.DataFrame]:
     session = next(session_gen)
     
     try:
-        # Query all players
-        players = session.query(Player).all()
+        # Read the columns straight from the cursor into a DataFrame, without
+        # hydrating a Player object per row; dtypes match the CSV loader.
+        # Rows are fetched DB_CHUNK_SIZE at a time, so only one chunk of raw
+        # row tuples is held alongside the typed columns
+        query = select(
+            Player.name, Player.runs, Player.wickets,
+            Player.strike_rate, Player.price, Player.role
+        ).order_by(Player.id)
+        chunks = pd.read_sql_query(
+            query,
+            session.connection(),
+            chunksize=DB_CHUNK_SIZE,
+            dtype={
+                'name': 'string[pyarrow]',
+                'runs': 'Int32',
+                'wickets': 'Int32',
+                'strike_rate': float,
+                'price': float,
+                'role': str
+            }
+        )
+        frames = [chunk for chunk in chunks if not chunk.empty]
         
-        if not players:
+        if not frames:
             logger.warning("Database is empty. Consider syncing CSV data.")
             return None
         
-        # Convert to DataFrame
-        data = []
-        for player in players:
-            data.append({
-                'name': player.name,
-                'runs': player.runs,
-                'wickets': player.wickets,
-                'strike_rate': player.strike_rate,
-                'price': player.price,
-                'role': player.role
-            })
-        
-        df = pd.DataFrame(data)
-        
-        # Set proper dtypes (same as CSV loader)
-        df = df.astype({
-            'name': str,
-            'runs': 'Int64',
-            'wickets': 'Int64',
-            'strike_rate': float,
-            'price': float,
-            'role': str
-        })
+        # Categories are set after the concat: chunks with different role
+        # categories would otherwise concatenate to object dtype
+        df = pd.concat(frames, ignore_index=True)
+        df['role'] = df['role'].astype('category')
         
         logger.info(f"✓ Loaded {len(df)} players from database")
         return df
@@ -1,6 +1,15 @@
+import numpy as np
 import pandas as pd
 
 
+def _score_kernel(runs: np.ndarray, wickets: np.ndarray, strike_rate: np.ndarray) -> np.ndarray:
+    """Apply the score formula to float64 arrays, accumulating into one output buffer."""
+    score = runs * 0.5
+    score += wickets * 20
+    score += strike_rate * 0.3
+    return score
+
+
 def calculate_score(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate player scores based on performance metrics.
@@ -17,21 +26,18 @@ def calculate_score(df: pd.DataFrame) -> pd.DataFrame:
     Raises:
         ValueError: If required columns are missing
     """
-    # Create a copy to avoid modifying original
-    df_copy = df.copy()
-    
     # Validate required columns
     required_columns = ["runs", "wickets", "strike_rate"]
-    missing_columns = set(required_columns) - set(df_copy.columns)
+    missing_columns = set(required_columns) - set(df.columns)
     
     if missing_columns:
         raise ValueError(f"Missing required columns: {missing_columns}")
     
-    # Calculate score using the formula
-    df_copy["score"] = (
-        (df_copy["runs"] * 0.5) +
-        (df_copy["wickets"] * 20) +
-        (df_copy["strike_rate"] * 0.3)
+    # Calculate score using the formula on plain float64 arrays (skips pandas'
+    # nullable/masked arithmetic). assign returns a new frame and leaves the
+    # original untouched; under Copy-on-Write the existing columns are shared
+    # rather than duplicated
+    score = _score_kernel(
+        *(df[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in required_columns)
     )
-    
-    return df_copy
+    return df.assign(score=score)
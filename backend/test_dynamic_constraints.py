@@ -4,6 +4,7 @@ Test script to verify dynamic role constraints in optimizer
 from data_loader import load_players
 from scoring import calculate_score
 from optimizer import optimize_team
+from collections import Counter
 
 
 def test_dynamic_role_constraints():
@@ -77,16 +78,13 @@ def test_dynamic_role_constraints():
             total_score = result['total_score']
             
             # Count roles in result
-            role_distribution = {}
-            for player in players:
-                role = player['role']
-                role_distribution[role] = role_distribution.get(role, 0) + 1
+            role_distribution = Counter(player['role'] for player in players)
             
             print(f"✓ Optimization successful!")
             print(f"  Team size: {len(players)} players")
             print(f"  Total cost: ${total_cost:.2f}")
             print(f"  Total score: {total_score:.2f}")
-            print(f"  Role distribution: {role_distribution}")
+            print(f"  Role distribution: {dict(role_distribution)}")
             
             # Verify constraints
             expected_constraints = test_case['constraints'] or {"WK": 1, "BAT": 4, "BOWL": 3, "ALL": 3}
@@ -99,7 +97,7 @@ def test_dynamic_role_constraints():
                     print(f"  ✗ {role}: {actual_count} (expected {expected_count}) MISMATCH!")
                     
             # Show top 3 players
-            top_players = sorted(players, key=lambda x: x['score'], reverse=True)[:3]
+            top_players = players[:3]  # optimize_team returns players by score, highest first
             print(f"\n  Top 3 players:")
             for p in top_players:
                 print(f"    - {p['name']} ({p['role']}): ${p['price']}, Score: {p['score']:.1f}")
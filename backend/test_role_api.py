@@ -5,6 +5,7 @@ from data_loader import load_players
 from scoring import calculate_score
 from optimizer import optimize_team
 import json
+from collections import Counter
 
 def test_players_endpoint():
     """Test that /players endpoint includes role field"""
@@ -65,10 +66,7 @@ def test_optimize_endpoint():
     print(f"✓ Sample optimized player: {first_player['name']} ({first_player['role']})")
     
     # Check role distribution in optimized team
-    team_roles = {}
-    for player in result['players']:
-        role = player['role']
-        team_roles[role] = team_roles.get(role, 0) + 1
+    team_roles = Counter(player['role'] for player in result['players'])
     
     print(f"✓ Team composition:")
     for role, count in sorted(team_roles.items()):
@@ -4,6 +4,8 @@ Test script to verify role-based constraints in optimizer
 from data_loader import load_players
 from scoring import calculate_score
 from optimizer import optimize_team
+from collections import Counter
+from operator import itemgetter
 
 
 def test_role_constraints():
@@ -63,10 +65,7 @@ def test_role_constraints():
             print(f"  ✓ Budget constraint: ${total_cost:.2f} <= ${budget}")
             
             # 3. Role constraints
-            role_distribution = {}
-            for player in players:
-                role = player['role']
-                role_distribution[role] = role_distribution.get(role, 0) + 1
+            role_distribution = Counter(player['role'] for player in players)
             
             print(f"\n  Role Distribution:")
             for role in ['WK', 'BAT', 'BOWL', 'ALL']:
@@ -92,7 +91,7 @@ def test_role_constraints():
                 role_players = [p for p in players if p['role'] == role]
                 if role_players:
                     print(f"    {role}:")
-                    for p in sorted(role_players, key=lambda x: x['score'], reverse=True):
+                    for p in sorted(role_players, key=itemgetter('score'), reverse=True):
                         print(f"      - {p['name']}: ${p['price']}, Score: {p['score']:.1f}")
             
         except ValueError as e:
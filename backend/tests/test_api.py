@@ -0,0 +1,203 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+import main
+from models import OptimizationStrategy
+from optimizer import optimize_team
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create a test client for the API, shared by the module.
+
+    Entering the client runs the app lifespan once and keeps one event loop
+    for every request, so the optimization batcher isn't restarted per call.
+    """
+    with TestClient(main.app) as client:
+        yield client
+
+def test_players_returns_etag(client):
+    """Test that /players returns all players with an ETag header."""
+    response = client.get("/players")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == f"public, max-age={main.PLAYERS_MAX_AGE}"
+    assert len(response.json()) == len(main.get_players_data().df)
+
+def test_players_not_modified_for_current_etag(client):
+    """Test that a matching If-None-Match gets an empty 304 response."""
+    etag = client.get("/players").headers["etag"]
+    
+    response = client.get("/players", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    
+    # Weak validators and lists of tags also match
+    response = client.get("/players", headers={"If-None-Match": f'"stale", W/{etag}'})
+    assert response.status_code == 304
+
+def test_players_stale_etag_gets_full_response(client):
+    """Test that a non-matching If-None-Match gets the full payload."""
+    response = client.get("/players", headers={"If-None-Match": '"stale"'})
+    
+    assert response.status_code == 200
+    assert response.json()
+
+def test_optimize_restricts_pool_to_player_ids(client):
+    """Test that only the requested players can be selected."""
+    player_ids = list(range(1, 60))
+    response = client.post("/optimize", json={"budget": 300, "player_ids": player_ids})
+    
+    assert response.status_code == 200
+    selected = {p["id"] for p in response.json()["players"]}
+    assert len(selected) == 11
+    assert selected <= set(player_ids)
+
+def test_optimize_rejects_unknown_player_ids(client):
+    """Test that unknown player ids are reported with a 400."""
+    response = client.post("/optimize", json={"budget": 175, "player_ids": [1, 9999]})
+    
+    assert response.status_code == 400
+    assert "9999" in response.json()["detail"]
+
+def test_optimize_cache_hit_returns_same_body(client):
+    """Test that a repeated request is served the same JSON bytes."""
+    first = client.post("/optimize", json={"budget": 180})
+    second = client.post("/optimize", json={"budget": 180})
+    
+    assert first.status_code == second.status_code == 200
+    assert second.headers["content-type"] == "application/json"
+    assert second.content == first.content
+
+def test_concurrent_optimize_requests():
+    """Test that concurrent requests with different strategies each get their own optimum."""
+    budget = 193  # Not requested elsewhere, so neither request is a cache hit
+    strategies = [OptimizationStrategy.MAX_SCORE, OptimizationStrategy.MAX_SCORE_PER_COST]
+    
+    async def post_all():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            return await asyncio.gather(*(
+                async_client.post("/optimize", json={"budget": budget, "strategy": strategy.value})
+                for strategy in strategies
+            ))
+    
+    responses = asyncio.run(post_all())
+    
+    def objective(players, strategy):
+        if strategy == OptimizationStrategy.MAX_SCORE_PER_COST:
+            return sum(p["score"] / p["price"] for p in players)
+        return sum(p["score"] for p in players)
+    
+    df = main.get_players_data().df
+    for strategy, response in zip(strategies, responses):
+        assert response.status_code == 200
+        expected = optimize_team(df, budget=budget, team_size=11, strategy=strategy)
+        # Ties between equally good teams may be broken differently, so
+        # compare the objective rather than the selection
+        actual = response.json()
+        assert objective(actual["players"], strategy) == pytest.approx(objective(expected["players"], strategy))
+        assert actual["total_cost"] <= budget
+
+def test_optimize_uses_one_snapshot_across_reload(client, monkeypatch):
+    """Test that a reload mid-request doesn't apply the new id map to the old frame."""
+    real_aget = main.optimization_cache.aget
+    smaller = main.get_players_data().df.head(20)
+    
+    async def reload_then_miss(key):
+        # Another request picks up a changed CSV while this one awaits the cache
+        monkeypatch.setattr(main, "_load_scored_players", lambda csv_mtime_ns: smaller)
+        main.get_players_data()
+        return await real_aget(key)
+    
+    monkeypatch.setattr(main.optimization_cache, "aget", reload_then_miss)
+    player_ids = list(range(100, 160))
+    response = client.post("/optimize", json={"budget": 301, "player_ids": player_ids})
+    
+    assert response.status_code == 200
+    selected = {p["id"] for p in response.json()["players"]}
+    assert len(selected) == 11
+    assert selected <= set(player_ids)
+
+def test_optimize_caches_under_fingerprint_of_solved_frame(client, monkeypatch):
+    """Test that a reload right after the data is fetched doesn't relabel the cached result."""
+    snapshot = main.get_players_data()
+    
+    def fetch_then_reload():
+        # The handler got this snapshot; another request then swaps in new data
+        monkeypatch.setattr(main, "_players_snapshot", snapshot._replace(fingerprint="reloaded"))
+        return snapshot
+    
+    stored_keys = []
+    real_aset = main.optimization_cache.aset
+    
+    async def recording_aset(key, value):
+        stored_keys.append(key)
+        await real_aset(key, value)
+    
+    monkeypatch.setattr(main, "get_players_data", fetch_then_reload)
+    monkeypatch.setattr(main.optimization_cache, "aset", recording_aset)
+    response = client.post("/optimize", json={"budget": 194})
+    
+    assert response.status_code == 200
+    assert stored_keys == [main.optimization_cache.get_cache_key(
+        budget=194, team_size=11, version=snapshot.fingerprint, strategy=str(OptimizationStrategy.MAX_SCORE)
+    )]
+
+def _parquet_pool():
+    """Serialize the players CSV (without scores) as a Parquet request body."""
+    buffer = io.BytesIO()
+    pd.read_csv(main.PLAYERS_CSV).to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+def test_optimize_bulk_returns_parquet_team(client):
+    """Test that a Parquet pool is optimized and the team returned as Parquet."""
+    response = client.post(
+        "/optimize_bulk",
+        params={"budget": 175},
+        content=_parquet_pool(),
+        headers={"Content-Type": "application/octet-stream"}
+    )
+    
+    assert response.status_code == 200
+    team = pd.read_parquet(io.BytesIO(response.content))
+    assert len(team) == 11
+    assert float(response.headers["x-total-cost"]) == pytest.approx(team["price"].sum())
+    assert float(response.headers["x-total-cost"]) <= 175
+    # Same pool and budget as the JSON endpoint, so the same optimum
+    json_result = client.post("/optimize", json={"budget": 175}).json()
+    assert float(response.headers["x-total-score"]) == pytest.approx(json_result["total_score"])
+
+def test_optimize_bulk_rejects_invalid_body(client):
+    """Test that a body that is not Parquet is rejected with a 400."""
+    response = client.post("/optimize_bulk", params={"budget": 175}, content=b"not parquet")
+    
+    assert response.status_code == 400
+    assert "Parquet" in response.json()["detail"]
+
+def test_concurrent_reload_loads_once(monkeypatch):
+    """Test that concurrent callers after a data change share a single load."""
+    calls = []
+    real_load_players = main.load_players
+    
+    def counting_load_players(csv_path):
+        calls.append(csv_path)
+        return real_load_players(csv_path)
+    
+    monkeypatch.setattr(main, "load_players", counting_load_players)
+    main._load_scored_players.cache_clear()
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            frames = list(pool.map(lambda _: main.get_players_data().df, range(8)))
+    finally:
+        main._load_scored_players.cache_clear()
+    
+    assert len(calls) == 1
+    assert all(frame is frames[0] for frame in frames)
@@ -0,0 +1,87 @@
+import asyncio
+import pandas as pd
+import pytest
+import batcher
+from batcher import OptimizationBatcher
+from models import OptimizationStrategy
+
+
+@pytest.fixture
+def recorded_batches(monkeypatch):
+    """Replace optimize_team_batch with a stub that records each batch it receives."""
+    calls = []
+
+    def fake_optimize_team_batch(df, requests):
+        calls.append(list(requests))
+        return [
+            ValueError("No optimal solution found. Status: Infeasible") if budget < 100
+            else {"players": [], "total_cost": float(budget), "total_score": 0.0}
+            for budget, team_size, strategy in requests
+        ]
+
+    monkeypatch.setattr(batcher, "optimize_team_batch", fake_optimize_team_batch)
+    return calls
+
+def _submit_all(opt_batcher, submissions):
+    async def run():
+        try:
+            return await asyncio.gather(
+                *(opt_batcher.submit(key, pd.DataFrame(), budget, 11, OptimizationStrategy.MAX_SCORE)
+                  for key, budget in submissions),
+                return_exceptions=True
+            )
+        finally:
+            await opt_batcher.stop()
+    return asyncio.run(run())
+
+def test_concurrent_requests_are_solved_in_one_batch(recorded_batches):
+    """Test that concurrent requests on the same pool share one solver call."""
+    results = _submit_all(OptimizationBatcher(max_wait_ms=50), [("pool", 150), ("pool", 175), ("pool", 200)])
+
+    assert len(recorded_batches) == 1
+    assert [budget for budget, _, _ in recorded_batches[0]] == [150, 175, 200]
+    assert [r["total_cost"] for r in results] == [150.0, 175.0, 200.0]
+
+def test_requests_on_different_pools_are_not_mixed(recorded_batches):
+    """Test that each player pool gets its own solver call."""
+    _submit_all(OptimizationBatcher(max_wait_ms=50), [("a", 150), ("b", 175), ("a", 200)])
+
+    assert sorted(len(batch) for batch in recorded_batches) == [1, 2]
+
+def test_batch_errors_are_delivered_per_request(recorded_batches):
+    """Test that an infeasible request fails without failing the rest of its batch."""
+    results = _submit_all(OptimizationBatcher(max_wait_ms=50), [("pool", 50), ("pool", 175)])
+
+    assert isinstance(results[0], ValueError)
+    assert results[1]["total_cost"] == 175.0
+
+def test_batch_size_limit(recorded_batches):
+    """Test that a batch never holds more than max_batch_size requests."""
+    _submit_all(OptimizationBatcher(max_batch_size=2, max_wait_ms=50), [("pool", b) for b in (150, 160, 170, 180, 190)])
+
+    assert max(len(batch) for batch in recorded_batches) == 2
+    assert sum(len(batch) for batch in recorded_batches) == 5
+
+def test_lone_request_skips_batch_window(recorded_batches):
+    """Test that a request with nothing queued behind it is solved without waiting."""
+    async def run():
+        opt_batcher = OptimizationBatcher(max_wait_ms=10_000)
+        try:
+            return await asyncio.wait_for(
+                opt_batcher.submit("pool", pd.DataFrame(), 175, 11, OptimizationStrategy.MAX_SCORE), 1
+            )
+        finally:
+            await opt_batcher.stop()
+
+    assert asyncio.run(run())["total_cost"] == 175.0
+
+def test_batch_failure_raises_a_copy_per_request(monkeypatch):
+    """Test that a failed batch gives each request its own exception instance."""
+    def failing_batch(df, requests):
+        raise RuntimeError("solver crashed")
+
+    monkeypatch.setattr(batcher, "optimize_team_batch", failing_batch)
+    results = _submit_all(OptimizationBatcher(max_wait_ms=50), [("pool", 150), ("pool", 175)])
+
+    assert all(isinstance(r, RuntimeError) and str(r) == "solver crashed" for r in results)
+    assert results[0] is not results[1]
@@ -0,0 +1,97 @@
+import asyncio
+import pytest
+import cache
+from cache import OptimizationCache
+
+
+@pytest.fixture
+def small_cache():
+    """Create a cache that holds at most two entries."""
+    return OptimizationCache(maxsize=2, ttl=60)
+
+def test_cache_key_includes_version_and_pool(small_cache):
+    """Test that the key changes with the dataset version and player pool."""
+    base = small_cache.get_cache_key(budget=175, team_size=11, version="a1")
+
+    assert small_cache.get_cache_key(budget=175, team_size=11, version="b2") != base
+    assert small_cache.get_cache_key(budget=175, team_size=11, version="a1", player_ids=[3, 1]) != base
+    # Pool order and duplicates don't matter
+    assert (
+        small_cache.get_cache_key(budget=175, team_size=11, version="a1", player_ids=[3, 1, 3])
+        == small_cache.get_cache_key(budget=175, team_size=11, version="a1", player_ids=[1, 3])
+    )
+
+def test_cache_evicts_least_recently_used(small_cache):
+    """Test that the oldest unused entry is dropped once maxsize is exceeded."""
+    small_cache.set("a", 1)
+    small_cache.set("b", 2)
+    # Touch "a" so "b" becomes the least recently used entry
+    assert small_cache.get("a") == 1
+    small_cache.set("c", 3)
+
+    assert len(small_cache) == 2
+    assert small_cache.get("b") is None
+    assert small_cache.get("a") == 1
+    assert small_cache.get("c") == 3
+
+def test_cache_entries_expire(small_cache, monkeypatch):
+    """Test that entries older than the TTL are treated as missing."""
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+
+    small_cache.set("a", 1)
+    now[0] += 59
+    assert small_cache.get("a") == 1
+
+    now[0] += 2
+    assert small_cache.get("a") is None
+    assert len(small_cache) == 0
+
+def test_create_cache_defaults_to_memory(monkeypatch):
+    """Test that the in-memory cache is used when REDIS_URL is not set."""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    
+    assert type(cache.create_optimization_cache()) is OptimizationCache
+
+def test_redis_cache_falls_back_to_memory_when_unreachable(monkeypatch):
+    """Test that cache calls keep working locally while Redis is down."""
+    pytest.importorskip("redis")
+    monkeypatch.setenv("REDIS_URL", "redis://127.0.0.1:1/0")
+    redis_cache = cache.create_optimization_cache()
+    assert isinstance(redis_cache, cache.RedisOptimizationCache)
+    
+    async def roundtrip():
+        try:
+            await redis_cache.aset("k", b"body")
+            return await redis_cache.aget("k")
+        finally:
+            await redis_cache.close()
+    
+    assert asyncio.run(roundtrip()) == b"body"
+
+def test_redis_cache_skips_redis_during_backoff(monkeypatch):
+    """Test that after a failure Redis is only retried once the retry interval has passed."""
+    pytest.importorskip("redis")
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    redis_cache = cache.RedisOptimizationCache("redis://127.0.0.1:1/0")
+    calls = []
+    
+    async def unreachable_get(key):
+        calls.append(key)
+        raise OSError("unreachable")
+    
+    monkeypatch.setattr(redis_cache._redis, "get", unreachable_get)
+    
+    async def lookups():
+        try:
+            await redis_cache.aget("a")
+            now[0] += cache.REDIS_RETRY_INTERVAL / 2
+            await redis_cache.aget("b")
+            now[0] += cache.REDIS_RETRY_INTERVAL
+            await redis_cache.aget("c")
+        finally:
+            await redis_cache.close()
+    
+    asyncio.run(lookups())
+    assert calls == ["a", "c"]
@@ -1,6 +1,7 @@
+import numpy as np
 import pandas as pd
 import pytest
-from data_loader import load_players
+from data_loader import df_records, df_records_at, load_players
 
 def test_load_players_success(tmp_path):
     """Test loading valid player data from CSV."""
@@ -46,3 +47,17 @@ def test_load_players_empty_file(tmp_path):
     
     with pytest.raises(ValueError):
         load_players(str(csv_file))
+
+def test_df_records_at_matches_df_records(tmp_path):
+    """Test that positional records match df_records on the sub-frame."""
+    csv_file = tmp_path / "players.csv"
+    csv_file.write_text(
+        "id,name,runs,wickets,strike_rate,price,role\n"
+        "1,Player1,100,2,120.5,10.0,BAT\n"
+        "2,Player2,50,5,110.0,8.5,BOWL\n"
+        "3,Player3,300,0,140.0,12.0,WK\n"
+    )
+    df = load_players(str(csv_file))
+    positions = np.array([2, 0], dtype=np.intp)
+    
+    assert df_records_at(df, positions) == df_records(df.iloc[positions])
@@ -1,33 +1,27 @@
+from collections import Counter
+import numpy as np
 import pandas as pd
 import pytest
-from optimizer import optimize_team
+import optimizer
+from optimizer import optimize_team, optimize_team_batch
 from models import OptimizationStrategy
 
 
-@pytest.fixture
-def optimization_dataset():
-    """Create a dataset that allows for a valid team selection."""
-    # Create 15 players with different roles and prices
-    # Roles: 2 WK, 5 BAT, 4 BOWL, 4 ALL
-    data = []
-    
-    # Wicket Keepers (need 1)
-    data.append({"name": "WK1", "role": "WK", "price": 10.0, "score": 100})
-    data.append({"name": "WK2", "role": "WK", "price": 8.0, "score": 80})
-    
-    # Batsmen (need 4)
-    for i in range(1, 6):
-        data.append({"name": f"BAT{i}", "role": "BAT", "price": 9.0, "score": 90})
-        
-    # Bowlers (need 3)
-    for i in range(1, 5):
-        data.append({"name": f"BOWL{i}", "role": "BOWL", "price": 8.5, "score": 85})
-        
-    # All Rounders (need 3)
-    for i in range(1, 5):
-        data.append({"name": f"ALL{i}", "role": "ALL", "price": 11.0, "score": 110})
-        
-    return pd.DataFrame(data)
+def _random_pool(seed, n, max_score=50):
+    """Seeded pool of n players with half-point prices from 5 to 20 and scores below max_score."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "name": [f"P{i}" for i in range(n)],
+        "role": rng.choice(["WK", "BAT", "BOWL", "ALL"], n),
+        "price": rng.integers(10, 41, n) * 0.5,
+        "score": rng.integers(0, max_score * 10, n) * 0.1,
+    })
+
+
+@pytest.fixture(scope="module")
+def solved_team(optimization_dataset):
+    """Team for budget 200 and the default roles, solved once for the tests that inspect it."""
+    return optimize_team(optimization_dataset, budget=200.0, team_size=11)
 
 def test_optimize_team_budget_constraint(optimization_dataset):
     """Test that the optimization respects the budget constraint."""
@@ -38,27 +32,215 @@ def test_optimize_team_budget_constraint(optimization_dataset):
     assert total_cost <= budget
     assert len(result["players"]) == 11
 
-def test_optimize_team_size_constraint(optimization_dataset):
+def test_optimize_team_size_constraint(solved_team):
     """Test that the optimization returns exactly the requested team size."""
-    team_size = 11
-    result = optimize_team(optimization_dataset, budget=200.0, team_size=team_size)
-    
-    assert len(result["players"]) == team_size
+    assert len(solved_team["players"]) == 11
 
-def test_optimize_team_role_constraints(optimization_dataset):
+def test_optimize_team_role_constraints(solved_team):
     """Test that default role constraints are met using default logic."""
     # Default constraints: WK=1, BAT=4, BOWL=3, ALL=3 = 11 total
-    result = optimize_team(optimization_dataset, budget=200.0, team_size=11)
-    
-    roles = [p["role"] for p in result["players"]]
+    roles = Counter(p["role"] for p in solved_team["players"])
     
-    assert roles.count("WK") == 1
-    assert roles.count("BAT") == 4
-    assert roles.count("BOWL") == 3
-    assert roles.count("ALL") == 3
+    assert roles["WK"] == 1
+    assert roles["BAT"] == 4
+    assert roles["BOWL"] == 3
+    assert roles["ALL"] == 3
+
+def test_optimize_team_players_ranked_by_score(solved_team):
+    """Test that the selected players are returned highest score first."""
+    scores = [p["score"] for p in solved_team["players"]]
+    assert scores == sorted(scores, reverse=True)
 
 def test_optimize_team_impossible_budget(optimization_dataset):
     """Test that optimization fails if budget is too low."""
     # Minimum cost for 11 players in dataset is around 102.5. So budget 50 should fail.
     with pytest.raises(ValueError, match="No optimal solution found"):
         optimize_team(optimization_dataset, budget=50.0, team_size=11)
+
+def test_optimize_team_unaffordable_budget_skips_solver(optimization_dataset, monkeypatch):
+    """Test that a budget below the cheapest valid team fails before a model is built."""
+    
+    def fail_build(*args, **kwargs):
+        raise AssertionError("model should not be built")
+    
+    monkeypatch.setattr(optimizer, "_build_problem", fail_build)
+    with pytest.raises(ValueError, match="No optimal solution found"):
+        optimize_team(optimization_dataset, budget=102.0, team_size=11)
+    # Not enough wicket keepers for the requested count
+    with pytest.raises(ValueError, match="No optimal solution found"):
+        optimize_team(optimization_dataset, budget=200.0, team_size=3, role_constraints={"WK": 3})
+
+def test_optimize_team_cheapest_team_budget_is_feasible(optimization_dataset):
+    """Test that a budget equal to the cheapest valid team's cost is solved."""
+    # Cheapest default team: 8 + 4 * 9 + 3 * 8.5 + 3 * 11 = 102.5
+    result = optimize_team(optimization_dataset, budget=102.5, team_size=11)
+    assert result["total_cost"] == pytest.approx(102.5)
+
+def test_optimize_team_slack_budget_skips_solver(optimization_dataset, monkeypatch):
+    """Test that a budget the best team fits regardless of price is answered without solving."""
+    
+    def fail_build(*args, **kwargs):
+        raise AssertionError("no solver should run")
+    
+    monkeypatch.setattr(optimizer, "_build_problem", fail_build)
+    monkeypatch.setattr(optimizer, "_build_knapsack_tables", fail_build)
+    # Best team: WK1 + 4 BAT + 3 BOWL + 3 ALL = 10 + 36 + 25.5 + 33 = 104.5
+    result = optimize_team(optimization_dataset, budget=104.5, team_size=11)
+    assert result["total_cost"] == pytest.approx(104.5)
+    assert result["total_score"] == pytest.approx(1045)
+    assert "WK1" in {p["name"] for p in result["players"]}
+
+def test_optimize_team_batch_matches_individual_solves(optimization_dataset):
+    """Test that batched requests return the same results as separate calls, in order."""
+    requests = [
+        (200.0, 11, OptimizationStrategy.MAX_SCORE),
+        (50.0, 11, OptimizationStrategy.MAX_SCORE),
+        (110.0, 11, OptimizationStrategy.MAX_SCORE),
+        (110.0, 11, OptimizationStrategy.MAX_SCORE_PER_COST),
+    ]
+    results = optimize_team_batch(optimization_dataset, requests)
+    
+    assert len(results) == len(requests)
+    # An infeasible budget fails only its own slot
+    assert isinstance(results[1], ValueError)
+    for (budget, team_size, strategy), result in zip(requests, results):
+        if isinstance(result, Exception):
+            continue
+        expected = optimize_team(optimization_dataset, budget=budget, team_size=team_size, strategy=strategy)
+        assert result["total_cost"] == expected["total_cost"]
+        assert result["total_score"] == expected["total_score"]
+
+def test_optimize_team_warm_start_from_previous_solve(optimization_dataset, monkeypatch):
+    """Test that a solve seeded with an earlier selection of the same pool stays optimal."""
+    # Warm starts only apply to the LP, so keep the knapsack and the slack
+    # budget shortcut (every budget here fits the best team) from taking over
+    monkeypatch.setattr(optimizer, "_KNAPSACK_MAX_CELLS", 0)
+    monkeypatch.setattr(optimizer, "_solve_if_budget_slack", lambda *args: None)
+    optimizer._warm_starts.clear()
+    optimize_team(optimization_dataset, budget=200.0, team_size=11)
+    assert len(optimizer._warm_starts) == 1
+    
+    # The stored budget-200 team is infeasible at 110; the solver must discard it
+    seeded = optimize_team(optimization_dataset, budget=110.0, team_size=11)
+    optimizer._warm_starts.clear()
+    cold = optimize_team(optimization_dataset, budget=110.0, team_size=11)
+    
+    assert seeded["total_cost"] <= 110.0
+    assert seeded["total_score"] == cold["total_score"]
+
+def test_optimize_team_selects_full_team_on_large_pool(monkeypatch):
+    """Test that every selected binary is picked up, even when not exactly 1.0."""
+    monkeypatch.setattr(optimizer, "_KNAPSACK_MAX_CELLS", 0)
+    df = _random_pool(4, 300, max_score=500)
+    result = optimize_team(df, budget=130, team_size=11)
+    assert len(result["players"]) == 11
+    assert result["total_cost"] <= 130
+
+@pytest.mark.parametrize("strategy", list(OptimizationStrategy))
+def test_optimize_team_without_roles_matches_lp(strategy):
+    """Test that the knapsack path for role_constraints={} finds the LP optimum."""
+    df = _random_pool(7, 40)
+    arrays = optimizer._player_arrays(df)
+    prob, player_vars = optimizer._build_problem(arrays, 6, {}, strategy)
+    
+    for budget in (40, 55, 80):
+        result = optimize_team(df, budget=budget, team_size=6, role_constraints={}, strategy=strategy)
+        expected = optimizer._solve_for_budget(prob, player_vars, df, arrays, budget)
+        
+        assert len(result["players"]) == 6
+        assert result["total_cost"] <= budget
+        objective = optimizer._objective_coefficients(
+            df["price"].tolist(), df["score"].tolist(), strategy
+        )
+        by_name = dict(zip(df["name"], objective))
+        assert sum(by_name[p["name"]] for p in result["players"]) == pytest.approx(
+            sum(by_name[p["name"]] for p in expected["players"])
+        )
+    
+    with pytest.raises(ValueError, match="No optimal solution found"):
+        optimize_team(df, budget=20, team_size=6, role_constraints={}, strategy=strategy)
+
+@pytest.mark.parametrize("strategy", list(OptimizationStrategy))
+@pytest.mark.parametrize("team_size, role_constraints", [
+    (11, None),
+    (6, {"WK": 1, "BAT": 2}),
+    (5, {"WK": 0, "BAT": 2, "BOWL": 1, "ALL": 2}),
+])
+def test_optimize_team_with_roles_matches_lp(strategy, team_size, role_constraints):
+    """Test that the role-group knapsack finds the LP optimum, including unconstrained slots."""
+    df = _random_pool(11, 60)
+    arrays = optimizer._player_arrays(df)
+    prob, player_vars = optimizer._build_problem(arrays, team_size, role_constraints, strategy)
+    objective = dict(zip(df["name"], optimizer._objective_coefficients(arrays.prices, arrays.scores, strategy)))
+    
+    for budget in (70, 110, 200):
+        result = optimize_team(
+            df, budget=budget, team_size=team_size, role_constraints=role_constraints, strategy=strategy
+        )
+        expected = optimizer._solve_for_budget(prob, player_vars, df, arrays, budget)
+        
+        assert len(result["players"]) == team_size
+        assert result["total_cost"] <= budget
+        roles = Counter(p["role"] for p in result["players"])
+        for role, count in (role_constraints or optimizer.DEFAULT_ROLE_CONSTRAINTS).items():
+            assert roles[role] == count
+        assert sum(objective[p["name"]] for p in result["players"]) == pytest.approx(
+            sum(objective[p["name"]] for p in expected["players"])
+        )
+
+def test_optimize_team_budget_sweep_reuses_knapsack_tables(monkeypatch):
+    """Test that the knapsack tables are built once per pool and strategy, not per budget."""
+    df = _random_pool(11, 60)
+    builds = []
+    real_build = optimizer._build_knapsack_tables
+    
+    def counting_build(*args, **kwargs):
+        builds.append(args)
+        return real_build(*args, **kwargs)
+    
+    monkeypatch.setattr(optimizer, "_build_knapsack_tables", counting_build)
+    # Budgets between the cheapest team ($68) and the best teams regardless
+    # of price, so the budget binds and the DP runs for both strategies
+    budgets = (80, 70, 75)
+    optimizer._knapsack_tables.clear()
+    results = [optimize_team(df, budget=budget, team_size=11) for budget in budgets]
+    assert len(builds) == 1
+    for budget, result in zip(budgets, results):
+        optimizer._knapsack_tables.clear()
+        assert result == optimize_team(df, budget=budget, team_size=11)
+    
+    # Another strategy or changed scores get their own tables
+    optimizer._knapsack_tables.clear()
+    builds.clear()
+    optimize_team(df, budget=75, team_size=11)
+    optimize_team(df, budget=75, team_size=11, strategy=OptimizationStrategy.MAX_SCORE_PER_COST)
+    optimize_team(df.assign(score=df["score"] + 1), budget=75, team_size=11)
+    assert len(builds) == 3
+
+def test_knapsack_table_cache_is_bounded_by_bytes(monkeypatch):
+    """Test that cached knapsack tables are evicted once their arrays exceed the byte limit."""
+    first = _random_pool(11, 60)
+    second = first.assign(score=first["score"] + 1)
+    optimizer._knapsack_tables.clear()
+    optimize_team(first, budget=75, team_size=11)
+    (first_tables,) = optimizer._knapsack_tables.values()
+    
+    # Room for one pool's tables: the least recently used one is dropped
+    monkeypatch.setattr(optimizer, "_KNAPSACK_CACHE_BYTES", first_tables.nbytes)
+    optimize_team(second, budget=75, team_size=11)
+    assert len(optimizer._knapsack_tables) <= 1
+    assert all(t is not first_tables for t in optimizer._knapsack_tables.values())
+    assert sum(t.nbytes for t in optimizer._knapsack_tables.values()) <= first_tables.nbytes
+    optimizer._knapsack_tables.clear()
+
+def test_optimize_team_budget_exact_with_decimal_prices():
+    """Test that a team costing exactly the budget in decimal prices is allowed."""
+    df = pd.DataFrame({
+        "name": ["A", "B", "C", "D"],
+        "role": ["BAT"] * 4,
+        "price": [0.1, 0.2, 0.7, 0.75],
+        "score": [1.0, 2.0, 7.0, 9.0],
+    })
+    result = optimize_team(df, budget=1.0, team_size=3, role_constraints={"BAT": 3})
+    assert sorted(p["name"] for p in result["players"]) == ["A", "B", "C"]
+    assert result["total_cost"] == pytest.approx(1.0)
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+import database
+from data_loader import load_players
+import player_repository
+from player_repository import load_players_from_database, sync_csv_to_database
+
+
+@pytest.fixture
+def sqlite_database(tmp_path, monkeypatch):
+    """Point the repository at a fresh SQLite database file."""
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'players.db'}")
+    assert database.init_database()
+    yield
+    database.close_database()
+
+@pytest.fixture
+def players_csv(tmp_path):
+    csv_file = tmp_path / "players.csv"
+    csv_file.write_text(
+        "name,runs,wickets,strike_rate,price,role\n"
+        "Player1,100,2,120.5,10.0,BAT\n"
+        "Player2,50,5,110.0,8.5,BOWL\n"
+        "Player3,300,0,140.0,12.0,WK\n"
+    )
+    return str(csv_file)
+
+def test_sync_csv_to_database_persists_players(sqlite_database, players_csv):
+    """Test that synced rows are committed and read back with the CSV values."""
+    assert sync_csv_to_database(players_csv) == 3
+    
+    df = load_players_from_database()
+    assert df is not None
+    assert df["name"].tolist() == ["Player1", "Player2", "Player3"]
+    assert df["runs"].tolist() == [100, 50, 300]
+    assert df["price"].tolist() == [10.0, 8.5, 12.0]
+
+def test_sync_csv_to_database_replaces_existing_rows(sqlite_database, players_csv):
+    """Test that a second sync does not duplicate players."""
+    sync_csv_to_database(players_csv)
+    sync_csv_to_database(players_csv)
+    
+    assert len(load_players_from_database()) == 3
+
+def test_load_players_from_database_dtypes(sqlite_database, players_csv):
+    """Test that database rows load with the same dtypes as the CSV loader."""
+    sync_csv_to_database(players_csv)
+    
+    df = load_players_from_database()
+    expected = load_players(players_csv).drop(columns="id")
+    assert df.dtypes.to_dict() == expected.dtypes.to_dict()
+
+def test_load_players_from_empty_database(sqlite_database):
+    """Test that an empty table reports no data instead of an empty frame."""
+    assert load_players_from_database() is None
+
+def test_load_players_from_database_in_chunks(sqlite_database, players_csv, monkeypatch):
+    """Test that a chunked read returns the same frame as a single chunk."""
+    sync_csv_to_database(players_csv)
+    expected = load_players_from_database()
+    
+    monkeypatch.setattr(player_repository, "DB_CHUNK_SIZE", 2)
+    df = load_players_from_database()
+    pd.testing.assert_frame_equal(df, expected)
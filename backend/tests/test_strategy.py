@@ -1,32 +1,13 @@
+from collections import Counter
 import pandas as pd
 import pytest
-from optimizer import optimize_team
+from optimizer import _objective_coefficients, optimize_team
 from models import OptimizationStrategy
 
-@pytest.fixture
-def optimization_dataset():
-    """Create a dataset that allows for a valid team selection."""
-    # Create 15 players with different roles and prices
-    # Roles: 2 WK, 5 BAT, 4 BOWL, 4 ALL
-    data = []
-    
-    # Wicket Keepers (need 1)
-    data.append({"name": "WK1", "role": "WK", "price": 10.0, "score": 100})
-    data.append({"name": "WK2", "role": "WK", "price": 8.0, "score": 80})
-    
-    # Batsmen (need 4)
-    for i in range(1, 6):
-        data.append({"name": f"BAT{i}", "role": "BAT", "price": 9.0, "score": 90})
-        
-    # Bowlers (need 3)
-    for i in range(1, 5):
-        data.append({"name": f"BOWL{i}", "role": "BOWL", "price": 8.5, "score": 85})
-        
-    # All Rounders (need 3)
-    for i in range(1, 5):
-        data.append({"name": f"ALL{i}", "role": "ALL", "price": 11.0, "score": 110})
-        
-    return pd.DataFrame(data)
+@pytest.fixture(scope="module")
+def solved_team(optimization_dataset):
+    """Team for budget 200 and the default roles, solved once for the tests that inspect it."""
+    return optimize_team(optimization_dataset, budget=200.0, team_size=11)
 
 def test_optimize_team_budget_constraint(optimization_dataset):
     """Test that the optimization respects the budget constraint."""
@@ -37,24 +18,19 @@ def test_optimize_team_budget_constraint(optimization_dataset):
     assert total_cost <= budget
     assert len(result["players"]) == 11
 
-def test_optimize_team_size_constraint(optimization_dataset):
+def test_optimize_team_size_constraint(solved_team):
     """Test that the optimization returns exactly the requested team size."""
-    team_size = 11
-    result = optimize_team(optimization_dataset, budget=200.0, team_size=team_size)
-    
-    assert len(result["players"]) == team_size
+    assert len(solved_team["players"]) == 11
 
-def test_optimize_team_role_constraints(optimization_dataset):
+def test_optimize_team_role_constraints(solved_team):
     """Test that default role constraints are met using default logic."""
     # Default constraints: WK=1, BAT=4, BOWL=3, ALL=3 = 11 total
-    result = optimize_team(optimization_dataset, budget=200.0, team_size=11)
+    roles = Counter(p["role"] for p in solved_team["players"])
     
-    roles = [p["role"] for p in result["players"]]
-    
-    assert roles.count("WK") == 1
-    assert roles.count("BAT") == 4
-    assert roles.count("BOWL") == 3
-    assert roles.count("ALL") == 3
+    assert roles["WK"] == 1
+    assert roles["BAT"] == 4
+    assert roles["BOWL"] == 3
+    assert roles["ALL"] == 3
 
 def test_optimize_team_impossible_budget(optimization_dataset):
     """Test that optimization fails if budget is too low."""
@@ -103,3 +79,10 @@ def test_optimization_strategies_logic():
     names_eff = sorted([p["name"] for p in res_eff["players"]])
     assert names_eff == ["P2", "P3"]
     assert res_eff["total_score"] == 120.0
+
+def test_efficiency_weights_handle_zero_prices():
+    """Test the MAX_SCORE_PER_COST weights, including free players."""
+    weights = _objective_coefficients(
+        [0.0, 0.0, 0.0, 2.0], [5.0, 0.0, -1.0, 3.0], OptimizationStrategy.MAX_SCORE_PER_COST
+    )
+    assert weights.tolist() == [5000.0, 0.0, 0.0, 1.5]
@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+from validator import (
+    ValidationError,
+    role_cheapest_costs,
+    validate_budget_range,
+    validate_dataframe,
+    validate_optimization_inputs,
+)
+
+
+def make_players(bowl_price: float) -> pd.DataFrame:
+    return pd.DataFrame({
+        "name": ["WK1", "BAT1", "BAT2", "BOWL1", "ALL1"],
+        "role": ["WK", "BAT", "BAT", "BOWL", "ALL"],
+        "price": [10.0, 8.0, 9.0, bowl_price, 11.0],
+    })
+
+def test_min_cost_uses_cheapest_players_per_role():
+    """Test that the minimum cost sums the cheapest required players of each role."""
+    df = make_players(bowl_price=7.0)
+    constraints = {"WK": 1, "BAT": 2, "BOWL": 1, "ALL": 1}
+    
+    validate_optimization_inputs(45, df, constraints)
+    with pytest.raises(ValidationError, match=r"Minimum cost .* is \$45\.00"):
+        validate_optimization_inputs(44, df, constraints)
+
+def test_min_cost_is_recomputed_for_a_new_frame():
+    """Test that the minimum cost follows the frame being validated."""
+    constraints = {"WK": 1, "BAT": 2, "BOWL": 1, "ALL": 1}
+    validate_optimization_inputs(45, make_players(bowl_price=7.0), constraints)
+    
+    with pytest.raises(ValidationError, match=r"is \$48\.00"):
+        validate_optimization_inputs(45, make_players(bowl_price=10.0), constraints)
+
+def test_min_cost_follows_in_place_price_changes():
+    """Test that an edited frame is validated with its current prices."""
+    df = make_players(bowl_price=7.0)
+    constraints = {"WK": 1, "BAT": 2, "BOWL": 1, "ALL": 1}
+    validate_optimization_inputs(45, df, constraints)
+    
+    df.loc[0, "price"] = 100.0
+    with pytest.raises(ValidationError, match=r"is \$135\.00"):
+        validate_optimization_inputs(45, df, constraints)
+
+def test_min_cost_uses_precomputed_role_costs():
+    """Test that role costs passed in by the caller give the same result as computing them."""
+    df = make_players(bowl_price=7.0)
+    constraints = {"WK": 1, "BAT": 2, "BOWL": 1, "ALL": 1}
+    role_costs = role_cheapest_costs(df)
+    
+    assert role_costs["BAT"].tolist() == [0.0, 8.0, 17.0]
+    validate_optimization_inputs(45, df, constraints, role_costs=role_costs)
+    with pytest.raises(ValidationError, match=r"is \$45\.00"):
+        validate_optimization_inputs(44, df, constraints, role_costs=role_costs)
+
+def test_validate_dataframe_reports_nulls_and_invalid_prices():
+    """Test the null and price checks of validate_dataframe."""
+    df = make_players(bowl_price=7.0).assign(score=1.0)
+    validate_dataframe(df)
+    
+    with_null = df.assign(price=[10.0, None, None, 7.0, 11.0])
+    with pytest.raises(ValidationError, match="Found 2 null values in column 'price'"):
+        validate_dataframe(with_null)
+    
+    free = df.assign(price=[10.0, 0.0, 9.0, -1.0, 11.0])
+    with pytest.raises(ValidationError, match=r"\['BAT1', 'BOWL1'\]"):
+        validate_dataframe(free)
+
+def test_insufficient_role_players_lists_availability():
+    """Test that a role shortfall reports the per-role availability."""
+    with pytest.raises(ValidationError, match=r"only 2 available.*'BAT': 2"):
+        validate_optimization_inputs(100, make_players(bowl_price=7.0), {"BAT": 3})
+
+def test_validate_budget_range_accepts_a_sweep():
+    """Test that a sequence of budgets is checked at once and reports the first bad one."""
+    validate_budget_range(200)
+    validate_budget_range([1, 200, 1000])
+    
+    with pytest.raises(ValidationError, match=r"Budget \$2000 exceeds"):
+        validate_budget_range([200, 2000, 0])
+    with pytest.raises(ValidationError, match=r"Budget \$0 is below"):
+        validate_budget_range([200, 0, 2000])
@@ -1,33 +1,29 @@
 """Test optimization with feasible and infeasible budgets."""
-import subprocess
-import json
+import asyncio
+import orjson
+import httpx
 
 API_URL = "http://localhost:8000/optimize"
 
-def test_budget(budget):
-    """Test optimization with given budget."""
+async def fetch_all(budgets):
+    """Post every budget at once, so the server solves them concurrently."""
+    async with httpx.AsyncClient(timeout=10) as client:
+        return await asyncio.gather(
+            *(client.post(API_URL, json={"budget": budget}) for budget in budgets),
+            return_exceptions=True
+        )
+
+def test_budget(budget, result):
+    """Report the optimization result for a budget (its response, or the request error)."""
     print("=" * 60)
     print(f"Testing Budget: ${budget}")
     print("=" * 60)
     
     try:
-        # Use curl to call the API
-        result = subprocess.run(
-            [
-                'curl', '-s', '-X', 'POST', API_URL,
-                '-H', 'Content-Type: application/json',
-                '-d', json.dumps({"budget": budget})
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if result.returncode != 0:
-            print(f"✗ curl error: {result.stderr}")
-            return False
-        
-        response = json.loads(result.stdout)
+        if isinstance(result, Exception):
+            raise result
+        # Parse the raw body with orjson, like the server serializes it
+        response = orjson.loads(result.content)
         
         if 'players' in response:
             players = response['players']
@@ -60,8 +56,8 @@ def test_budget(budget):
             
             # Show top 5 players by score
             print(f"\nTop 5 players:")
-            sorted_players = sorted(players, key=lambda x: x['score'], reverse=True)
-            for i, p in enumerate(sorted_players[:5], 1):
+            top_players = players[:5]  # The API returns players by score, highest first
+            for i, p in enumerate(top_players, 1):
                 print(f"  {i}. {p['name']:<20} Score: {p['score']:>6.1f}  Price: ${p['price']:>4.0f}")
             
             return constraints_met
@@ -74,12 +70,15 @@ def test_budget(budget):
             print(f"✗ Unexpected response: {response}")
             return False
             
-    except subprocess.TimeoutExpired:
+    except httpx.TimeoutException:
         print(f"✗ Timeout: API did not respond within 10 seconds")
         return False
-    except json.JSONDecodeError as e:
+    except httpx.HTTPError as e:
+        print(f"✗ Request error: {e}")
+        return False
+    except orjson.JSONDecodeError as e:
         print(f"✗ JSON decode error: {e}")
-        print(f"   Response: {result.stdout}")
+        print(f"   Response: {result.text}")
         return False
     except Exception as e:
         print(f"✗ Error: {e}")
@@ -94,12 +93,17 @@ if __name__ == "__main__":
     print("=" * 60)
     print()
     
-    # Test requested budgets (expected infeasible)
+    # Send every request up front; results are printed in order below
     requested_budgets = [50, 100, 150]
+    feasible_budgets = [170, 185, 200]
+    all_budgets = requested_budgets + feasible_budgets
+    responses = dict(zip(all_budgets, asyncio.run(fetch_all(all_budgets))))
+    
+    # Test requested budgets (expected infeasible)
     print("PHASE 1: Testing Requested Budgets (Expected: INFEASIBLE)")
     print("-" * 60)
     for budget in requested_budgets:
-        test_budget(budget)
+        test_budget(budget, responses[budget])
     
     # Test feasible budgets to demonstrate constraints work
     print("\n" + "=" * 60)
@@ -107,10 +111,9 @@ if __name__ == "__main__":
     print("-" * 60)
     print()
     
-    feasible_budgets = [170, 185, 200]
     results = []
     for budget in feasible_budgets:
-        success = test_budget(budget)
+        success = test_budget(budget, responses[budget])
         results.append((budget, success))
     
     # Final summary
@@ -1,9 +1,12 @@
 """Test optimization with different budgets."""
-import subprocess
-import json
+import orjson
+import httpx
 
 API_URL = "http://localhost:8000/optimize"
 
+# One client for all budgets: keeps the connection alive between requests
+CLIENT = httpx.Client(timeout=10)
+
 def test_budget(budget):
     """Test optimization with given budget."""
     print("=" * 50)
@@ -11,23 +14,9 @@ def test_budget(budget):
     print("=" * 50)
     
     try:
-        # Use curl to call the API
-        result = subprocess.run(
-            [
-                'curl', '-s', '-X', 'POST', API_URL,
-                '-H', 'Content-Type: application/json',
-                '-d', json.dumps({"budget": budget})
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if result.returncode != 0:
-            print(f"✗ curl error: {result.stderr}")
-            return
-        
-        response = json.loads(result.stdout)
+        result = CLIENT.post(API_URL, json={"budget": budget})
+        # Parse the raw body with orjson, like the server serializes it
+        response = orjson.loads(result.content)
         
         if 'players' in response:
             players = response['players']
@@ -48,8 +37,8 @@ def test_budget(budget):
             
             # Show top 3 players by score
             print(f"\nTop 3 players:")
-            sorted_players = sorted(players, key=lambda x: x['score'], reverse=True)
-            for i, p in enumerate(sorted_players[:3], 1):
+            top_players = players[:3]  # The API returns players by score, highest first
+            for i, p in enumerate(top_players, 1):
                 print(f"  {i}. {p['name']}: {p['score']:.1f} (${p['price']:.0f})")
                 
         elif 'detail' in response:
@@ -58,11 +47,13 @@ def test_budget(budget):
         else:
             print(f"✗ Unexpected response: {response}")
             
-    except subprocess.TimeoutExpired:
+    except httpx.TimeoutException:
         print(f"✗ Timeout: API did not respond within 10 seconds")
-    except json.JSONDecodeError as e:
+    except httpx.HTTPError as e:
+        print(f"✗ Request error: {e}")
+    except orjson.JSONDecodeError as e:
         print(f"✗ JSON decode error: {e}")
-        print(f"   Response: {result.stdout}")
+        print(f"   Response: {result.text}")
     except Exception as e:
         print(f"✗ Error: {e}")
     
@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Sequence, Union
 
 
 class ValidationError(Exception):
@@ -7,10 +8,27 @@ class ValidationError(Exception):
     pass
 
 
+def role_cheapest_costs(df: pd.DataFrame) -> Dict[Any, np.ndarray]:
+    """
+    Per role, the cost of its k cheapest players for every k.
+    
+    costs[role][k] is the sum of the k lowest prices of that role (so
+    costs[role][0] == 0 and len(costs[role]) - 1 players are available),
+    from one grouping pass over the frame.
+    """
+    role_costs = {}
+    for role, prices in df.groupby('role', sort=False, observed=True)['price']:
+        costs = np.zeros(len(prices) + 1)
+        np.cumsum(np.sort(prices.to_numpy(dtype=np.float64)), out=costs[1:])
+        role_costs[role] = costs
+    return role_costs
+
+
 def validate_optimization_inputs(
     budget: int,
     df: pd.DataFrame,
-    role_constraints: Optional[Dict[str, int]] = None
+    role_constraints: Optional[Dict[str, int]] = None,
+    role_costs: Optional[Dict[Any, np.ndarray]] = None
 ) -> None:
     """
     Validate inputs before team optimization.
@@ -25,6 +43,8 @@ def validate_optimization_inputs(
         df: DataFrame with columns: name, price, role
         role_constraints: Dict mapping role names to required counts
                          (default: {"WK": 1, "BAT": 4, "BOWL": 3, "ALL": 3})
+        role_costs: role_cheapest_costs(df), when the caller already has it
+                   (e.g. built once per data load); computed from df otherwise
     
     Raises:
         ValidationError: If any validation check fails
@@ -52,13 +72,16 @@ def validate_optimization_inputs(
             f"Missing required columns in player data: {missing_columns}"
         )
     
-    # Validation 3: Check enough players available per role
-    role_availability = df['role'].value_counts().to_dict()
+    if role_costs is None:
+        role_costs = role_cheapest_costs(df)
     
+    # Validation 3: Check enough players available per role
     for role, required_count in role_constraints.items():
-        available_count = role_availability.get(role, 0)
+        available_count = len(role_costs[role]) - 1 if role in role_costs else 0
         
         if available_count < required_count:
+            # The availability summary is only built for the error message
+            role_availability = {r: len(costs) - 1 for r, costs in role_costs.items()}
             raise ValidationError(
                 f"Insufficient players for role '{role}': "
                 f"Required {required_count}, but only {available_count} available. "
@@ -67,23 +90,16 @@ def validate_optimization_inputs(
     
     # Validation 4: Calculate minimum possible team cost
     min_cost = 0
-    cheapest_players_used = set()
     
     for role, required_count in role_constraints.items():
-        # Get players of this role
-        role_players = df[df['role'] == role].copy()
-        
-        if role_players.empty:
+        if role not in role_costs:
             raise ValidationError(
                 f"No players available for role '{role}'. "
-                f"Available roles: {list(role_availability.keys())}"
+                f"Available roles: {list(role_costs.keys())}"
             )
         
-        # Get cheapest players for this role
-        cheapest_role_players = role_players.nsmallest(required_count, 'price')
-        
-        # Add to minimum cost
-        min_cost += cheapest_role_players['price'].sum()
+        # Add the cheapest players for this role to the minimum cost
+        min_cost += float(role_costs[role][required_count])
     
     # Check if budget is sufficient
     if budget < min_cost:
@@ -98,18 +114,31 @@ def validate_optimization_inputs(
     return None
 
 
-def validate_budget_range(budget: int, min_budget: int = 1, max_budget: int = 1000) -> None:
+def validate_budget_range(
+    budget: Union[int, Sequence[int], np.ndarray],
+    min_budget: int = 1,
+    max_budget: int = 1000
+) -> None:
     """
     Validate budget is within acceptable range.
     
     Args:
-        budget: Budget to validate
+        budget: Budget to validate, or a sequence/array of budgets (e.g. a
+            budget sweep), checked in one vectorized comparison
         min_budget: Minimum acceptable budget (default: 1)
         max_budget: Maximum acceptable budget (default: 1000)
     
     Raises:
-        ValidationError: If budget is out of range
+        ValidationError: If a budget is out of range (the first one for a sequence)
     """
+    if np.ndim(budget) > 0:
+        budgets = np.asarray(budget)
+        out_of_range = (budgets < min_budget) | (budgets > max_budget)
+        if not out_of_range.any():
+            return
+        # Report the first offending budget with the scalar message
+        budget = budgets[out_of_range.argmax()].item()
+    
     if budget < min_budget:
         raise ValidationError(
             f"Budget ${budget} is below minimum allowed budget ${min_budget}"
@@ -145,19 +174,22 @@ def validate_dataframe(df: pd.DataFrame) -> None:
             f"Available columns: {list(df.columns)}"
         )
     
-    # Check for null values in critical columns
+    # Check for null values in critical columns (one isna pass over the
+    # three columns; per-column counts only on error)
     critical_columns = ["name", "price", "role"]
-    for col in critical_columns:
-        null_count = df[col].isnull().sum()
-        if null_count > 0:
-            raise ValidationError(
-                f"Found {null_count} null values in column '{col}'. "
-                f"All players must have valid {col} values."
-            )
+    null_mask = df[critical_columns].isna()
+    if null_mask.any(axis=None):
+        null_counts = null_mask.sum()
+        col = null_counts[null_counts > 0].index[0]
+        raise ValidationError(
+            f"Found {null_counts[col]} null values in column '{col}'. "
+            f"All players must have valid {col} values."
+        )
     
-    # Check for invalid prices
-    if (df['price'] <= 0).any():
-        invalid_players = df[df['price'] <= 0]['name'].tolist()
+    # Check for invalid prices (one NumPy compare, reused for the names)
+    invalid = df['price'].to_numpy() <= 0
+    if invalid.any():
+        invalid_players = df['name'][invalid].tolist()
         raise ValidationError(
             f"Found players with invalid prices (<=0): {invalid_players}"
         )